@@ -1,2 +1,7 @@
 """Module provides Base dataclass for subclassing, providing validation functionality of dataclass params."""
-from type_validator import TypeValidator, NotEmpty, ValueRange, LimitedLength, Options, BaseDataclass, StrictDataclass
+from type_validator import (
+    TypeValidator, ValidationResult, ValidationError, BatchResult, Profiler,
+    NotEmpty, ValueRange, LimitedLength, Options, Sampling,
+    BaseDataclass, StrictDataclass, FrozenBaseDataclass, FrozenStrictDataclass, AsyncStrictDataclass,
+    RecordError, iter_validated,
+)
@@ -0,0 +1,76 @@
+"""Speed of generated validation functions against plan dispatch and a handwritten check.
+
+Not collected by a default `pytest` run. Execute explicitly: `pytest benchmarks/bench_codegen.py -s`
+"""
+import timeit
+from dataclasses import dataclass
+from typing import Annotated, Optional
+
+import pytest
+
+from type_validator.base_validator import TypeValidator
+from type_validator.validators import ValueRange
+
+NUMBER = 50_000
+
+
+@dataclass
+class Record:
+    name: str = 'record'
+    count: int = 1
+    ratio: float = 0.5
+    flag: bool = True
+    comment: Optional[str] = None
+    score: Annotated[int, ValueRange(0, 100)] = 50
+    point: tuple[int, int, str] = (1, 2, 'label')
+
+
+def handwritten_check(record: Record) -> list[str]:
+    errors = []
+    if not isinstance(record.name, str):
+        errors.append('name')
+    if not isinstance(record.count, int):
+        errors.append('count')
+    if not isinstance(record.ratio, float):
+        errors.append('ratio')
+    if not isinstance(record.flag, bool):
+        errors.append('flag')
+    if not isinstance(record.comment, (str, type(None))):
+        errors.append('comment')
+    if not isinstance(record.score, int) or not 0 <= record.score <= 100:
+        errors.append('score')
+    point = record.point
+    if not isinstance(point, tuple) or not (
+            isinstance(point[0], int) and isinstance(point[1], int) and isinstance(point[2], str)
+    ):
+        errors.append('point')
+    return errors
+
+
+def ops_per_sec(func) -> float:
+    func()  # Warm up compiled plan / generated function.
+    return NUMBER / min(timeit.repeat(func, number=NUMBER, repeat=5))
+
+
+@pytest.mark.benchmark
+def test_codegen_against_plan_and_handwritten():
+    record = Record()
+    plan_validator, codegen_validator = TypeValidator(), TypeValidator(codegen=True)
+    # Bare generated function, without a result of a call. Valid record never puts errors, so it's safe here.
+    generated = codegen_validator.get_validate_function(Record)
+
+    results = {
+        'handwritten': ops_per_sec(lambda: handwritten_check(record)),
+        'generated': ops_per_sec(lambda: generated(record)),
+        'plan': ops_per_sec(lambda: plan_validator.check_types(record)),
+        'codegen': ops_per_sec(lambda: codegen_validator.check_types(record)),
+    }
+    for engine, ops in results.items():
+        print(f'{engine:>12}: {ops:,.0f} checks/sec')
+
+    # Public `codegen=True` path should run at least at a third of the speed of a handwritten check.
+    # It's 0.4-0.7 of it: a valid instance is checked without a result of a call. See `TypeValidator._passes_inlined`.
+    # The gap between `generated` and `codegen` is a lookup of a function and building of a returned result.
+    assert codegen_validator.check_types(record) == plan_validator.check_types(record) == (True, [])
+    assert results['codegen'] > results['plan'], results
+    assert results['codegen'] > results['handwritten'] / 3, results
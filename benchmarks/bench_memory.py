@@ -0,0 +1,98 @@
+"""Memory benchmarks of a validation hot path.
+
+Not collected by a default `pytest` run. Execute explicitly: `pytest benchmarks/bench_memory.py`
+"""
+import tracemalloc
+from dataclasses import dataclass, field
+
+import pytest
+
+from type_validator.base_dataclass import StrictDataclass, FrozenStrictDataclass
+
+SIZES = (1_000, 10_000, 50_000)
+INSTANCES = 100_000
+
+
+@dataclass
+class Record(StrictDataclass):
+    readings: list[int] = field(default_factory=list)
+    tags: dict[str, int] = field(default_factory=dict)
+
+
+def peak_validation_memory(record: Record) -> int:
+    """Peak of allocated bytes while validating already built record."""
+    record.check_properties_type()  # Warm up compiled plan.
+    tracemalloc.start()
+    try:
+        record.check_properties_type()
+        record.run_prop_validator_funcs()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.mark.benchmark
+def test_validation_memory_flat_on_container_growth():
+    peaks = {}
+    for size in SIZES:
+        record = Record(list(range(size)), {str(i): i for i in range(size)})
+        peaks[size] = peak_validation_memory(record)
+        print(f'size={size:>7}: peak {peaks[size]} bytes')
+
+    # Copying of containers would take at least 8 bytes per list entry.
+    assert max(peaks.values()) < SIZES[0] * 8, peaks
+    assert peaks[SIZES[-1]] <= peaks[SIZES[0]] * 2, peaks
+
+
+@dataclass
+class DictRecord(StrictDataclass):
+    name: str
+    value: int
+    ratio: float
+
+
+@dataclass(slots=True)
+class SlottedRecord(StrictDataclass):
+    name: str
+    value: int
+    ratio: float
+
+
+@dataclass(frozen=True)
+class FrozenRecord(FrozenStrictDataclass):
+    name: str
+    value: int
+    ratio: float
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenSlottedRecord(FrozenStrictDataclass):
+    name: str
+    value: int
+    ratio: float
+
+
+def bytes_per_instance(record_cls: type) -> float:
+    """Average of bytes allocated per validated instance. Values are shared, so only instances are counted."""
+    name, ratio = 'record', 0.5
+    record_cls(name, 0, ratio)  # Warm up compiled plan.
+    tracemalloc.start()
+    try:
+        records = [record_cls(name, 0, ratio) for _ in range(INSTANCES)]
+        allocated = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    assert len(records) == INSTANCES
+    return allocated / INSTANCES
+
+
+@pytest.mark.benchmark
+def test_bytes_per_instance():
+    sizes = {}
+    for record_cls in (DictRecord, SlottedRecord, FrozenRecord, FrozenSlottedRecord):
+        sizes[record_cls.__name__] = bytes_per_instance(record_cls)
+        print(f'{record_cls.__name__:>20}: {sizes[record_cls.__name__]:.1f} bytes per instance')
+
+    # Slotted instances have no `__dict__`.
+    assert sizes['SlottedRecord'] < sizes['DictRecord'] * 0.75, sizes
+    assert sizes['FrozenSlottedRecord'] < sizes['FrozenRecord'] * 0.75, sizes
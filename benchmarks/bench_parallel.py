@@ -0,0 +1,46 @@
+"""Scaling benchmark of `TypeValidator.validate_parallel` over worker processes.
+
+Not collected by a default `pytest` run. Execute explicitly: `pytest benchmarks/bench_parallel.py -s`
+"""
+import os
+import time
+from dataclasses import dataclass, field
+
+import pytest
+
+from type_validator.base_dataclass import BaseDataclass
+from type_validator.base_validator import TypeValidator
+
+ROWS = 400_000
+WORKERS = tuple(workers for workers in (1, 2, 4, 8) if workers <= (os.cpu_count() or 1))
+
+
+@dataclass
+class Record(BaseDataclass):
+    name: str = 'record'
+    value: int = 0
+    tags: dict[str, list[int]] = field(default_factory=dict)
+
+
+def rows():
+    for i in range(ROWS):
+        yield {'name': f'record_{i}', 'value': str(i) if i % 100 == 0 else i, 'tags': {'a': [i, i + 1]}}
+
+
+@pytest.mark.benchmark
+def test_validate_parallel_scaling():
+    type_validator = TypeValidator()
+    rows_per_sec = {}
+    for workers in WORKERS:
+        start = time.perf_counter()
+        failed = sorted(row_index for row_index, _ in type_validator.validate_parallel(
+            Record, rows(), workers=workers, chunksize=5_000
+        ))
+        elapsed = time.perf_counter() - start
+        rows_per_sec[workers] = ROWS / elapsed
+        print(f'workers={workers}: {rows_per_sec[workers]:,.0f} rows/sec')
+
+        assert failed == list(range(0, ROWS, 100))
+
+    # Workers share nothing but rows, so throughput should grow with a number of cores.
+    assert rows_per_sec[WORKERS[-1]] >= rows_per_sec[1] * 0.5 * WORKERS[-1], rows_per_sec
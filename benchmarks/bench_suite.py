@@ -0,0 +1,147 @@
+"""Throughput and allocation benchmarks over annotation shapes and sizes, with regression check against a baseline.
+
+Not collected by a default `pytest` run. Execute explicitly: `pytest benchmarks/bench_suite.py -s`
+
+Results are compared with a baseline saved by a previous run, on the same machine: `benchmarks/baseline.json`.
+    Case fails, when its median ops/sec of `BENCH_REPEATS` (7) runs dropped more than `BENCH_THRESHOLD`
+    (0.5 by default, i.e. 50%) below a baseline: timings of tiny cases swing by 20-40% between runs.
+    Case is skipped, when spread of its own runs is above the threshold: it can't be compared reliably.
+    Baseline is saved, when it doesn't exist, or `BENCH_UPDATE_BASELINE=1` is set. Missing cases are added to it.
+"""
+import json
+import os
+import statistics
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass, field, make_dataclass
+from pathlib import Path
+from typing import Annotated, Any, Optional, Union
+
+import pytest
+
+from type_validator.base_dataclass import StrictDataclass
+from type_validator.base_validator import TypeValidator
+from type_validator.validators import LimitedLength, NotEmpty, Options, Sampling, ValueRange
+
+BASELINE_PATH = Path(os.environ.get('BENCH_BASELINE', Path(__file__).with_name('baseline.json')))
+THRESHOLD = float(os.environ.get('BENCH_THRESHOLD', '0.5'))
+REPEATS = int(os.environ.get('BENCH_REPEATS', '7'))
+UPDATE_BASELINE = os.environ.get('BENCH_UPDATE_BASELINE') == '1'
+SIZES = (1, 100, 10_000, 1_000_000)
+
+
+def validation_case(annotation, value) -> Callable[[], Any]:
+    """Check of a dataclass with a single param. Value is built once, so only validation is measured."""
+    dtcls = make_dataclass('Case', [('value', annotation, field(default=None))])
+    instance, type_validator = dtcls(value), TypeValidator()
+    res, errors = type_validator.check_types(instance)
+    assert res is True, errors
+    return lambda: type_validator.check_types(instance)
+
+
+@dataclass
+class Record(StrictDataclass):
+    name: str
+    value: int
+    ratio: Optional[float]
+    tags: list[str] = field(default_factory=list)
+    scores: dict[str, int] = field(default_factory=dict)
+
+
+RECORD_KWARGS = {'name': 'record', 'value': 1, 'ratio': 0.5, 'tags': ['a', 'b'], 'scores': {'a': 1}}
+
+
+def record_init_case() -> Callable[[], Any]:
+    return lambda: Record(**RECORD_KWARGS)
+
+
+def dict2object_case() -> Callable[[], Any]:
+    record = Record(**RECORD_KWARGS)
+    return lambda: record.dict2object(RECORD_KWARGS)
+
+
+CASES: dict[str, Callable[[], Callable[[], Any]]] = {
+    'str': lambda: validation_case(str, 'value'),
+    'int': lambda: validation_case(int, 1),
+    'float': lambda: validation_case(float, 1.0),
+    'bool': lambda: validation_case(bool, True),
+    'bytes': lambda: validation_case(bytes, b'value'),
+    'union': lambda: validation_case(Union[int, str], 'value'),
+    'optional': lambda: validation_case(Optional[int], None),
+    **{f'list[int]-{size}': lambda size=size: validation_case(list[int], list(range(size))) for size in SIZES},
+    **{f'set[int]-{size}': lambda size=size: validation_case(set[int], set(range(size))) for size in SIZES},
+    **{
+        f'tuple[int, ...]-{size}': lambda size=size: validation_case(tuple[int, ...], tuple(range(size)))
+        for size in SIZES
+    },
+    **{
+        f'dict[str, int]-{size}': lambda size=size: validation_case(dict[str, int], {str(i): i for i in range(size)})
+        for size in SIZES
+    },
+    'annotated-ValueRange': lambda: validation_case(Annotated[int, ValueRange(0, 10)], 5),
+    'annotated-NotEmpty': lambda: validation_case(Annotated[str, NotEmpty()], 'value'),
+    'annotated-Options': lambda: validation_case(Annotated[int, Options(list(range(1000)))], 999),
+    'annotated-LimitedLength': lambda: validation_case(Annotated[str, LimitedLength(10)], 'value'),
+    'annotated-Sampling-1000000': lambda: validation_case(
+        Annotated[list[int], Sampling(head=100, tail=100, random=100)], list(range(1_000_000))
+    ),
+    'StrictDataclass-init': record_init_case,
+    'StrictDataclass-dict2object': dict2object_case,
+}
+
+baseline: dict[str, dict] = json.loads(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else {}
+results: dict[str, dict] = {}
+
+
+def measure(func: Callable[[], Any]) -> dict:
+    """Median of `REPEATS` runs, each of at least 0.2 sec, spread of runs, and allocations of a single call.
+
+    Spread is `(<fastest> - <slowest>) / <median>` of ops/sec.
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    ops = [number / elapsed for elapsed in timer.repeat(repeat=REPEATS, number=number)]
+    median = statistics.median(ops)
+
+    tracemalloc.start()
+    try:
+        func()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        'ops_per_sec': median, 'spread': (max(ops) - min(ops)) / median, 'peak_bytes': peak, 'retained_bytes': current,
+    }
+
+
+@pytest.fixture(scope='module', autouse=True)
+def save_baseline():
+    yield
+    if results and (UPDATE_BASELINE or not baseline or results.keys() - baseline.keys()):
+        saved = {**baseline, **{
+            case: result for case, result in results.items() if UPDATE_BASELINE or case not in baseline
+        }}
+        BASELINE_PATH.write_text(json.dumps(saved, indent=2, sort_keys=True) + '\n')
+        print(f'Baseline saved: {BASELINE_PATH}')
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize('case', CASES)
+def test_throughput(case: str):
+    result = results[case] = measure(CASES[case]())
+    expected = baseline.get(case)
+    line = (
+        f'{case:>28}: {result["ops_per_sec"]:>14,.1f} ops/sec (spread {result["spread"]:.0%}), '
+        f'peak {result["peak_bytes"]:>8} bytes'
+    )
+    if expected is not None:
+        line += f' ({result["ops_per_sec"] / expected["ops_per_sec"] - 1:+.0%} vs baseline)'
+    print(line)
+
+    if expected is not None and not UPDATE_BASELINE:
+        if result['spread'] > THRESHOLD:
+            pytest.skip(f'{case} is too noisy to compare: spread of repeats is {result["spread"]:.0%}')
+        assert result['ops_per_sec'] >= expected['ops_per_sec'] * (1 - THRESHOLD), (
+            f'{case} regressed: {result["ops_per_sec"]:,.1f} ops/sec, baseline {expected["ops_per_sec"]:,.1f}'
+        )
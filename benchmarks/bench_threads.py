@@ -0,0 +1,50 @@
+"""Multi-threaded stress benchmark of a shared `TypeValidator`.
+
+Not collected by a default `pytest` run. Execute explicitly: `pytest benchmarks/bench_threads.py -s`
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+import pytest
+
+from type_validator.base_dataclass import BaseDataclass
+
+CALLS_PER_THREAD = 20_000
+THREADS = (1, 2, 4, 8)
+
+
+@dataclass
+class Record(BaseDataclass):
+    name: str = 'record'
+    value: int = 0
+    tags: dict[str, int] = field(default_factory=lambda: {'a': 1, 'b': 2})
+
+
+def worker(thread_id: int) -> int:
+    """Validate a mix of valid/invalid records. Returns count of mismatched results."""
+    mismatches = 0
+    valid, invalid = Record(value=thread_id), Record(value=str(thread_id))
+    for i in range(CALLS_PER_THREAD):
+        record = invalid if i % 3 == 0 else valid
+        res, errors = Record.TYPE_VALIDATOR.check_types(record)
+        if res is (i % 3 == 0) or len(errors) != (i % 3 == 0) or any(f'Value {thread_id},' not in str(e) for e in errors):
+            mismatches += 1
+    return mismatches
+
+
+@pytest.mark.benchmark
+def test_shared_validator_throughput_under_threads():
+    ops_per_sec = {}
+    for threads in THREADS:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            mismatches = sum(pool.map(worker, range(threads)))
+        elapsed = time.perf_counter() - start
+        ops_per_sec[threads] = threads * CALLS_PER_THREAD / elapsed
+        print(f'threads={threads}: {ops_per_sec[threads]:,.0f} checks/sec')
+
+        assert mismatches == 0, f'{mismatches} results were mixed up between threads'
+
+    # No locks are taken: adding threads must not collapse total throughput (GIL bound builds stay ~flat).
+    assert min(ops_per_sec.values()) > ops_per_sec[1] * 0.5, ops_per_sec
@@ -1,11 +1,20 @@
-from dataclasses import dataclass, field
-from typing import List, Set, Mapping, Union, Any, Dict, Tuple, Final, Annotated, Optional
+import asyncio
+import io
+import json
+import mmap
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import FrozenInstanceError, dataclass, field
+from typing import List, Set, Mapping, Union, Any, Dict, Tuple, Final, Annotated, Optional, ClassVar, get_origin
 
 import pytest
 
 from type_validator.base_validator import TypeValidator
-from type_validator.base_dataclass import BaseDataclass, StrictDataclass
-from type_validator.validators import NotEmpty, ValueRange, Options, LimitedLength
+from type_validator.base_dataclass import (
+    BaseDataclass, StrictDataclass, FrozenBaseDataclass, FrozenStrictDataclass, AsyncStrictDataclass,
+)
+from type_validator.validators import NotEmpty, ValueRange, Options, LimitedLength, Sampling, ValidatorBase
+from type_validator.errors import ValidationError
+from type_validator.streaming import RecordError, iter_validated
 
 
 @pytest.mark.internal
@@ -163,13 +172,14 @@ from type_validator.validators import NotEmpty, ValueRange, Options, LimitedLeng
     (str | None, None, True, []),
     (str | None, 1, False, ["""Expected that attr "test_variable" would be of type "(<class \'str\'>, <class \'NoneType\'>)". Value 1, of type "<class \'int\'>" was passed."""]),
 ])
-def test_type_checker(param_type, param_value, is_obj_valid, exp_errors):
+@pytest.mark.parametrize('codegen', [False, True])
+def test_type_checker(param_type, param_value, is_obj_valid, exp_errors, codegen):
     @dataclass
     class TestDataClass:
         test_variable: param_type = param_value
 
     tdc = TestDataClass()
-    checker = TypeValidator()
+    checker = TypeValidator(codegen=codegen)
     act_res, act_errors = checker.check_types(tdc)
     assert act_res == is_obj_valid and act_errors == exp_errors, \
         (f'Case failed: {param_type} = {param_value}.\n'
@@ -221,3 +231,865 @@ def test_strict_dtcls_calls_custom_prop_validators_with_invalid_value():
 
     with pytest.raises(ValueError):
         NotZero(0)
+
+
+@pytest.mark.internal
+def test_validation_plan_cached_on_class():
+    @dataclass
+    class TestDataClass:
+        test_variable: int = 1
+
+    checker = TypeValidator()
+    plan = checker.get_plan(TestDataClass)
+    checker.check_types(TestDataClass())
+
+    assert checker.get_plan(TestDataClass) is plan
+    assert [attr_name for attr_name, _ in plan] == ['test_variable']
+
+
+@pytest.mark.internal
+def test_validation_plan_rebuilt_on_validators_update():
+    @dataclass
+    class TestDataClass:
+        test_variable: int = 1
+
+    checker = TypeValidator()
+    plan = checker.get_plan(TestDataClass)
+    checker.update_validators(int, lambda attr_name, attr_value, exp_type: checker.put_error(attr_name, attr_value, exp_type))
+
+    assert checker.get_plan(TestDataClass) is not plan
+    assert checker.check_types(TestDataClass())[0] is False
+
+
+@pytest.mark.internal
+def test_validation_plan_cached_per_validator():
+    @dataclass
+    class TestDataClass:
+        test_variable: int = 1
+
+    checker, other_checker = TypeValidator(), TypeValidator(values_cache_size=10)
+    plan, other_plan = checker.get_plan(TestDataClass), other_checker.get_plan(TestDataClass)
+
+    assert checker.get_plan(TestDataClass) is plan and other_checker.get_plan(TestDataClass) is other_plan
+    assert plan is not other_plan
+    # Validators with default settings share plans.
+    assert TypeValidator().get_plan(TestDataClass) is plan
+
+
+@pytest.mark.internal
+def test_dict_validator_not_affected_by_errors_of_other_params():
+    @dataclass
+    class TestDataClass:
+        first_variable: int = 'bad_val'
+        test_variable: dict[str, int] = field(default_factory=lambda: {'key': 'bad_val'})
+
+    res, errors = TypeValidator().check_types(TestDataClass())
+    assert res is False and len(errors) == 2
+
+
+@pytest.mark.internal
+def test_shared_type_validator_across_threads():
+    @dataclass
+    class TestDataClass:
+        test_variable: int = 1
+
+    checker = TypeValidator()
+
+    def check(value):
+        return checker.check_types(TestDataClass(value))
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(check, [i if i % 2 else str(i) for i in range(2000)]))
+
+    for i, (res, errors) in enumerate(results):
+        assert res is bool(i % 2)
+        assert len(errors) == (0 if i % 2 else 1)
+        assert all(f'Value {i},' in str(error) for error in errors)
+
+
+@dataclass
+class BatchDataClass:
+    name: Annotated[str, NotEmpty()]
+    score: Annotated[int, ValueRange(0, 10)]
+    tags: list[str] = field(default_factory=list)
+    kind: str | None = None
+
+
+@pytest.mark.internal
+def test_check_many_instances():
+    rows = [BatchDataClass('a', 1), BatchDataClass('', 1), BatchDataClass('c', 11, ['t', 1]), BatchDataClass('d', 2)]
+    result = TypeValidator().check_many(BatchDataClass, rows)
+
+    assert result.valid is False and len(result) == 4
+    assert result.failed == [1, 2]
+    assert len(result.errors[1]) == 1 and len(result.errors[2]) == 2
+    assert result.errors[1] == TypeValidator().check_types(rows[1])[1]
+
+
+@pytest.mark.internal
+def test_check_many_columns():
+    columns = {'name': ['a', 'b', 1], 'score': [0, 'bad_val', 20], 'kind': ['k', None, 0]}
+    result = TypeValidator().check_many(BatchDataClass, columns)
+
+    assert result.failed == [1, 2]
+    assert len(result.errors[1]) == 1 and len(result.errors[2]) == 3
+
+
+@pytest.mark.internal
+@pytest.mark.parametrize('columns', [
+    {'name': ['a'], 'score': [1, 2]},
+    {'name': ['a']},
+])
+def test_check_many_bad_columns(columns):
+    with pytest.raises(ValueError):
+        TypeValidator().check_many(BatchDataClass, columns)
+
+
+@pytest.mark.internal
+def test_validation_error_rendered_lazily():
+    @dataclass
+    class TestDataClass:
+        test_variable: Annotated[list, LimitedLength(2)] = field(default_factory=lambda: [1, 2, 3])
+
+    tdc = TestDataClass()
+    error, = TypeValidator().check_types(tdc)[1]
+
+    assert error.path == 'test_variable' and error.value is tdc.test_variable
+    assert error.validator == LimitedLength(2)
+    assert str(ValueError([error])) == str(ValueError([error.message]))
+
+
+@pytest.mark.internal
+def test_validation_error_truncated_value(monkeypatch):
+    monkeypatch.setattr(ValidationError, 'max_value_length', 10)
+    error = ValidationError('test_variable', list(range(100_000)), list[str])
+
+    assert 'Value [0, 1, 2, ..., of type' in error.message
+
+
+@pytest.mark.internal
+@pytest.mark.parametrize('fail_fast, max_errors, exp_errors_count', [
+    (False, None, 4),
+    (True, None, 1),
+    (False, 2, 2),
+    (False, 10, 4),
+])
+def test_check_types_errors_limit(fail_fast, max_errors, exp_errors_count):
+    @dataclass
+    class TestDataClass:
+        first_variable: int = 'bad_val'
+        test_variable: dict[str, int] = field(default_factory=lambda: {'a': 'bad_val', 'b': 'bad_val', 'c': 'bad_val'})
+
+    res, errors = TypeValidator().check_types(TestDataClass(), fail_fast=fail_fast, max_errors=max_errors)
+    assert res is False and len(errors) == exp_errors_count
+
+
+@pytest.mark.internal
+def test_strict_dtcls_fail_fast():
+    @dataclass
+    class TestDataClass(StrictDataclass):
+        FAIL_FAST = True
+
+        first_variable: int = 'bad_val'
+        test_variable: str = 1
+
+    with pytest.raises(ValueError) as exc_info:
+        TestDataClass()
+    assert len(exc_info.value.args[0]) == 1
+
+
+@dataclass
+class NestedChild:
+    test_variable: int = 0
+    tags: list[str] = field(default_factory=list)
+
+
+@dataclass
+class Node:
+    child: Optional['Node'] = None
+
+
+@pytest.mark.internal
+@pytest.mark.parametrize('param_type, param_value, exp_paths', [
+    (list[dict[str, tuple[int, ...]]], [{'key': (1, 2)}], []),
+    (list[dict[str, tuple[int, ...]]], [{'key': (1, 'bad_val')}], ["test_variable[0]['key']"]),
+    (list[list[int]], [[1], [2]], []),
+    (list[list[int]], [[1], ['bad_val']], ['test_variable[1]']),
+    (list[int] | set[str], [1, 2], []),
+    (list[int] | set[str], ('bad_val', ), ['test_variable']),
+    (Optional[NestedChild], None, []),
+    (Optional[NestedChild], NestedChild(1, ['tag']), []),
+    (Optional[NestedChild], NestedChild('bad_val', [1]), ['test_variable.test_variable', 'test_variable.tags']),
+    (NestedChild, 'bad_val', ['test_variable']),
+    (dict[str, list[NestedChild]], {'key': [NestedChild(), NestedChild(tags=[1])]}, ["test_variable['key'][1].tags"]),
+    (tuple[str, list[int]], ('item_1', ['bad_val']), ['test_variable[1]']),
+    (Annotated[list[int], NotEmpty()], [], ['test_variable']),
+    (Annotated[list[int], NotEmpty()], ['bad_val'], ['test_variable']),
+    (Optional[Any], [], []),
+])
+def test_nested_type_checker(param_type, param_value, exp_paths):
+    @dataclass
+    class TestDataClass:
+        test_variable: param_type = field(default_factory=lambda: param_value)
+
+    act_res, act_errors = TypeValidator().check_types(TestDataClass())
+    assert act_res is (not exp_paths) and [error.path for error in act_errors] == exp_paths
+
+
+@pytest.mark.internal
+def test_nested_checkers_memoized():
+    @dataclass
+    class TestDataClass:
+        first_variable: list[dict[str, int]] = field(default_factory=list)
+        test_variable: list[dict[str, int]] = field(default_factory=list)
+
+    checker = TypeValidator(checkers_cache_size=2)
+    plan = checker.get_plan(TestDataClass)
+
+    assert plan[0][1] is plan[1][1]
+    assert len(checker._checkers) == 2
+
+
+@pytest.mark.internal
+@pytest.mark.parametrize('param_type, bad_index, exp_valid, exp_sampled', [
+    (Annotated[list[int], Sampling(head=2, tail=2, random=0)], 500, True, ['test_variable']),
+    (Annotated[list[int], Sampling(head=2, tail=2, random=0)], 1, False, ['test_variable']),
+    (Annotated[list[int], Sampling(head=2, tail=2, random=0)], 998, False, ['test_variable']),
+    (Annotated[tuple[int, ...], Sampling(head=2, tail=2, random=0)], 500, True, ['test_variable']),
+    (Annotated[dict[int, int], Sampling(head=2, tail=2, random=0)], 500, True, ['test_variable']),
+    (Annotated[list[int], Sampling(head=2000)], 500, False, []),
+    (list[int], 500, False, []),
+])
+def test_sampled_collections(param_type, bad_index, exp_valid, exp_sampled):
+    value = list(range(1000))
+    value[bad_index] = 'bad_val'
+    if get_origin(param_type.__origin__) is tuple:
+        value = tuple(value)
+    elif get_origin(param_type.__origin__) is dict:
+        value = dict(enumerate(value))
+
+    @dataclass
+    class TestDataClass:
+        test_variable: param_type = field(default_factory=lambda: value)
+
+    result = TypeValidator().validate(TestDataClass())
+    assert result.valid is exp_valid and result.sampled == exp_sampled
+
+
+@pytest.mark.internal
+def test_class_sampling_skip_unchanged():
+    @dataclass
+    class TestDataClass(BaseDataclass):
+        SAMPLING = Sampling(skip_unchanged=True)
+
+        test_variable: list[int] = field(default_factory=lambda: [1, 2])
+
+    tdc = TestDataClass()
+    assert tdc.TYPE_VALIDATOR.validate(tdc).sampled == []
+    assert tdc.TYPE_VALIDATOR.validate(tdc).sampled == ['test_variable']
+
+    tdc.test_variable.append('bad_val')
+    assert tdc.TYPE_VALIDATOR.validate(tdc).valid is False
+
+
+@dataclass
+class FromDictDataClass(StrictDataclass):
+    test_variable: int
+    tags: list[str] = field(default_factory=list)
+
+
+@pytest.mark.internal
+def test_from_dict():
+    tdc = FromDictDataClass.from_dict({'test_variable': 1, 'tags': ['tag']})
+    assert tdc == FromDictDataClass(1, ['tag'])
+
+
+@pytest.mark.internal
+@pytest.mark.parametrize('kwargs, exp_exception', [
+    ({'test_variable': 'bad_val'}, ValueError),
+    ({'test_variable': 1, 'tags': [1]}, ValueError),
+    ({'test_variable': 1, 'unknown': 1}, AttributeError),
+])
+def test_from_dict_raises(kwargs, exp_exception):
+    with pytest.raises(exp_exception):
+        FromDictDataClass.from_dict(kwargs)
+
+
+@pytest.mark.internal
+def test_from_dict_validates_values_once():
+    checked = []
+
+    @dataclass
+    class TestDataClass(StrictDataclass):
+        TYPE_VALIDATOR = TypeValidator()
+
+        test_variable: int
+        default_variable: int = 0
+
+    TestDataClass.TYPE_VALIDATOR.update_validators(
+        int, lambda attr_name, attr_value, exp_type: checked.append(attr_name)
+    )
+    TestDataClass.from_dict({'test_variable': 1})
+
+    assert sorted(checked) == ['default_variable', 'test_variable']
+
+
+@pytest.mark.internal
+def test_from_dicts_lazy():
+    rows = iter([{'test_variable': 1}, {'test_variable': 'bad_val'}])
+    instances = FromDictDataClass.from_dicts(rows)
+
+    assert next(instances) == FromDictDataClass(1)
+    with pytest.raises(ValueError):
+        next(instances)
+
+
+@pytest.mark.internal
+def test_dict2object():
+    tdc = FromDictDataClass(1)
+    tdc.dict2object({'test_variable': 2})
+    assert tdc.test_variable == 2
+
+    with pytest.raises(ValueError):
+        tdc.dict2object({'test_variable': 'bad_val'})
+    with pytest.raises(AttributeError):
+        tdc.dict2object({'unknown': 1})
+
+
+@pytest.mark.internal
+def test_validate_on_assignment():
+    @dataclass
+    class TestDataClass(StrictDataclass):
+        VALIDATE_ON_ASSIGNMENT = True
+
+        test_variable: int = 0
+
+        def test_variable_validator(self):
+            if self.test_variable == 13:
+                raise ValueError('test_variable could not be 13')
+
+    tdc = TestDataClass()
+    tdc.test_variable = 1
+    with pytest.raises(ValueError):
+        tdc.test_variable = 'bad_val'
+    with pytest.raises(ValueError):
+        tdc.test_variable = 13
+    assert tdc.test_variable == 1
+
+
+@pytest.mark.internal
+def test_revalidate_only_changed_params():
+    checked = []
+
+    @dataclass
+    class TestDataClass(StrictDataclass):
+        TYPE_VALIDATOR = TypeValidator()
+        TRACK_CHANGES = True
+
+        test_variable: str = ''
+        other_variable: str = ''
+
+    TestDataClass.TYPE_VALIDATOR.update_validators(
+        str, lambda attr_name, attr_value, exp_type: checked.append(attr_name)
+    )
+    tdc = TestDataClass()
+    checked.clear()
+
+    tdc.test_variable = 'new'
+    tdc.revalidate()
+    tdc.revalidate()
+
+    assert checked == ['test_variable']
+
+
+@pytest.mark.internal
+def test_codegen_inlined_function_checked_optimistically():
+    @dataclass
+    class TestDataClass:
+        first_variable: int = 1
+        test_variable: Annotated[int, ValueRange(0, 5)] = 1
+
+    checker = TypeValidator(codegen=True)
+    outer = TypeValidator()
+    outer.update_validators(str, lambda attr_name, attr_value, exp_type: checker.check_types(TestDataClass('bad_val')))
+
+    @dataclass
+    class OuterDataClass:
+        test_variable: str = ''
+
+    assert checker.get_validate_function(TestDataClass).inlined is True
+    assert checker.check_types(TestDataClass()) == (True, [])
+    assert checker.validate(TestDataClass()).valid is True
+    assert [error.path for error in checker.check_types(TestDataClass('bad_val', 6))[1]] == [
+        'first_variable', 'test_variable'
+    ]
+    assert [error.path for error in checker.check_types(TestDataClass('bad_val', 6), fail_fast=True)[1]] == [
+        'first_variable'
+    ]
+    # Errors of a nested validation don't leak into a validation in progress.
+    assert outer.check_types(OuterDataClass()) == (True, [])
+
+
+class Positive:
+    """Duck-typed validator: only `validate` is defined."""
+
+    def validate(self, value):
+        return value > 0, ' Value should be > 0.'
+
+
+@pytest.mark.internal
+@pytest.mark.parametrize('codegen', [False, True])
+def test_duck_typed_annotated_validator(codegen):
+    @dataclass
+    class TestDataClass:
+        test_variable: Annotated[int, Positive(), ValueRange(0, 5)] = 1
+
+    checker = TypeValidator(codegen=codegen)
+
+    assert checker.check_types(TestDataClass())[0] is True
+    errors = checker.check_types(TestDataClass(-1))[1]
+    assert [error.message.split('was passed.')[1] for error in errors] == [
+        ' Value should be > 0.', 'Value "-1" should met this condition: 0 <= <value> <= 5.'
+    ]
+    profiler = checker.enable_profiling()
+    checker.check_types(TestDataClass(-1))
+    assert profiler.as_dict()[TestDataClass.__qualname__]['test_variable']['Positive']['failures'] == 1
+
+
+@pytest.mark.internal
+def test_codegen_validate_function():
+    @dataclass
+    class TestDataClass:
+        first_variable: int = 'bad_val'
+        test_variable: tuple[str, int, Any] = ('item_1', 'bad_val', None)
+        nested_variable: list[NestedChild] = field(default_factory=lambda: [NestedChild('bad_val')])
+
+    checker = TypeValidator(codegen=True)
+    res, errors = checker.check_types(TestDataClass())
+
+    # Validators with default settings share generated functions.
+    assert TypeValidator().get_validate_function(TestDataClass) is checker.get_validate_function(TestDataClass)
+    assert res is False and [error.path for error in errors] == [
+        'first_variable', 'test_variable', 'nested_variable[0].test_variable'
+    ]
+    assert errors == TypeValidator().check_types(TestDataClass())[1]
+
+
+class AsyncOptions(ValidatorBase):
+    def __init__(self, *options):
+        self.options = options
+        self.running = 0
+        self.max_running = 0
+
+    async def validate(self, value) -> tuple[bool, str]:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        if value in self.options:
+            return True, ''
+        return False, f'Value {value} not in {self.options}.'
+
+
+@pytest.mark.internal
+def test_async_validators():
+    validator = AsyncOptions(1, 2)
+
+    @dataclass
+    class TestDataClass:
+        first_variable: Annotated[int, validator] = 1
+        test_variable: Annotated[int, ValueRange(0, 5), validator] = 3
+        other_variable: list[Annotated[int, validator]] = field(default_factory=lambda: [1, 2, 5, 6])
+        bad_variable: Annotated[int, validator] = 'bad_val'
+
+    res, errors = asyncio.run(TypeValidator().acheck_types(TestDataClass(), concurrency=2))
+
+    assert res is False and [error.path for error in errors] == [
+        'bad_variable', 'test_variable', 'other_variable[2]', 'other_variable[3]'
+    ]
+    assert str(errors[1]).endswith('Value 3 not in (1, 2).')
+    assert validator.max_running == 2
+    with pytest.raises(TypeError):
+        TypeValidator().check_types(TestDataClass())
+
+
+@pytest.mark.internal
+def test_async_strict_dataclass():
+    @dataclass
+    class TestDataClass(AsyncStrictDataclass):
+        test_variable: Annotated[int, AsyncOptions(1, 2)] = 1
+
+        async def test_variable_validator(self):
+            await asyncio.sleep(0)
+            if self.test_variable == 2:
+                raise ValueError('test_variable could not be 2')
+
+    assert asyncio.run(TestDataClass.create(test_variable=1)).test_variable == 1
+    with pytest.raises(ValueError):
+        asyncio.run(TestDataClass.create(test_variable=3))
+    with pytest.raises(ValueError):
+        asyncio.run(TestDataClass.create(test_variable=2))
+    with pytest.raises(TypeError):
+        TestDataClass().run_prop_validator_funcs()
+    # Type checks aren't skipped outside of `create`.
+    with pytest.raises(ValueError):
+        TestDataClass('bad_val')
+    with pytest.raises(ValueError):
+        TestDataClass.from_dict({'test_variable': 'bad_val'})
+    # Only checks left for `create` are kept, and only while they are pending.
+    assert [check[:2] for check in TestDataClass(3)._pending_checks] == [('test_variable', 3)]
+    assert asyncio.run(TestDataClass.create(test_variable=1))._pending_checks is None
+
+
+@pytest.mark.internal
+def test_validate_parallel():
+    rows = [{'test_variable': i, 'tags': ['tag']} for i in range(10)]
+    rows[3]['test_variable'] = 'bad_val'
+    rows[7]['tags'] = ['tag', 7]
+    rows[8] = {'tags': ['tag']}
+    rows[9]['unknown'] = 1
+
+    failures = dict(TypeValidator().validate_parallel(FromDictDataClass, iter(rows), workers=2, chunksize=3))
+
+    assert sorted(failures) == [3, 7, 8, 9]
+    assert failures[7] == [
+        """Expected that attr "tags" would be of type "list[str]". Value ['tag', 7], of type "<class 'list'>" was passed."""
+    ]
+    assert failures[8] == ["Required params of FromDictDataClass are missing: ['test_variable']"]
+    assert failures[9] == ["FromDictDataClass has no params: ['unknown']"]
+
+
+@pytest.mark.internal
+@pytest.mark.parametrize('validator, values, exp_mask', [
+    (ValueRange(0, 5), [0, 6, 5, -1], [True, False, True, False]),
+    (NotEmpty(), ['a', '', [1], []], [True, False, True, False]),
+    (Options(['a', 'b']), ['a', 'c', 'b', 'd'], [True, False, True, False]),
+    (LimitedLength(2), ['ab', 'abc', [1], [1, 2, 3]], [True, False, True, False]),
+])
+def test_validate_many(validator, values, exp_mask):
+    mask, failing = validator.validate_many(values)
+
+    assert list(mask) == exp_mask == [validator.is_valid(value) for value in values]
+    assert failing == [1, 3]
+
+
+@pytest.mark.internal
+def test_validate_many_numpy_arrays():
+    np = pytest.importorskip('numpy')
+
+    mask, failing = ValueRange(0, 5).validate_many(np.array([0, 6, 5, -1]))
+    assert mask.tolist() == [True, False, True, False] and failing == [1, 3]
+    assert LimitedLength(2).validate_many(np.array(['ab', 'abc']))[1] == [1]
+    assert Options(['a', 'b']).validate_many(np.array(['a', 'c']))[1] == [1]
+
+
+@pytest.mark.internal
+def test_annotated_entries_validated_at_once():
+    entry_type = Annotated[int, ValueRange(0, 5), Options([1, 2, 3, 6])]
+
+    @dataclass
+    class TestDataClass:
+        test_variable: list[entry_type] = field(default_factory=lambda: [1, 6, 0, 2])
+        other_variable: list[entry_type] = field(default_factory=lambda: [1, 'bad_val'])
+
+    res, errors = TypeValidator().check_types(TestDataClass())
+
+    assert res is False
+    assert [(error.path, error.validator) for error in errors] == [
+        ('test_variable[1]', ValueRange(0, 5)), ('test_variable[2]', Options([1, 2, 3, 6])), ('other_variable[1]', None)
+    ]
+
+
+@pytest.mark.internal
+def test_options_index():
+    validator = Options(['a', 'b', ['c'], {'d': 1}])
+
+    assert [validator.is_valid(value) for value in ('a', ['c'], {'d': 1}, 'c', ['a'], {'e'})] == [
+        True, True, True, False, False, False
+    ]
+    assert validator.validate_many(['b', ['a'], 'e'])[1] == [1, 2]
+    assert Options(['a']).validate_many(['a', ['a']])[1] == [1]
+    assert validator == Options(['a', 'b', ['c'], {'d': 1}])
+
+
+@pytest.mark.internal
+def test_direct_validator_calls_are_memoized():
+    checker = TypeValidator()
+
+    first = checker._base_checker(TypeValidator._compile_set_n_list, list[int | str])
+
+    assert checker._base_checker(TypeValidator._compile_set_n_list, list[int | str]) is first
+    assert checker._base_checker(TypeValidator._compile_union, int | str) is not first
+
+
+@pytest.mark.internal
+def test_profiling():
+    @dataclass
+    class TestDataClass:
+        test_variable: Annotated[int, ValueRange(0, 5)] = 3
+        other_variable: list[str] = field(default_factory=lambda: ['a'])
+
+    checker = TypeValidator(codegen=True)
+    profiler = checker.enable_profiling()
+    for test_variable in (1, 6, 'bad_val'):
+        checker.check_types(TestDataClass(test_variable=test_variable))
+
+    stats = profiler.as_dict()['test_profiling.<locals>.TestDataClass']
+    assert stats['test_variable']['annotated_validator']['calls'] == 3
+    assert stats['test_variable']['annotated_validator']['failures'] == 2
+    assert stats['test_variable']['ValueRange']['calls'] == 2
+    assert stats['test_variable']['ValueRange']['failures'] == 1
+    assert stats['other_variable']['set_n_list_validator']['failures'] == 0
+    assert (
+        'type_validator_failures_total{dataclass="test_profiling.<locals>.TestDataClass",param="test_variable",'
+        'validator="ValueRange"} 1'
+    ) in profiler.to_prometheus()
+
+    assert checker.disable_profiling() is profiler
+    checker.check_types(TestDataClass())
+    assert profiler.stats[('test_profiling.<locals>.TestDataClass', 'test_variable', 'annotated_validator')].calls == 3
+
+
+@pytest.mark.internal
+def test_slotted_dataclass():
+    @dataclass(slots=True)
+    class TestDataClass(StrictDataclass):
+        TRACK_CHANGES = True
+
+        test_variable: int = 0
+
+    tdc = TestDataClass(1)
+    assert not hasattr(tdc, '__dict__')
+    with pytest.raises(ValueError):
+        TestDataClass('bad_val')
+
+    tdc.test_variable = 'bad_val'
+    with pytest.raises(ValueError):
+        tdc.revalidate()
+
+
+@pytest.mark.internal
+def test_frozen_dataclass_remembers_validation():
+    checked = []
+
+    @dataclass(frozen=True, slots=True)
+    class TestDataClass(FrozenStrictDataclass):
+        TYPE_VALIDATOR = TypeValidator()
+
+        test_variable: str = ''
+
+    TestDataClass.TYPE_VALIDATOR.update_validators(
+        str, lambda attr_name, attr_value, exp_type: checked.append(attr_name)
+    )
+    tdc = TestDataClass('test')
+    tdc.check_properties_type()
+    tdc.revalidate()
+
+    assert checked == ['test_variable']
+    assert not hasattr(tdc, '__dict__') and tdc == TestDataClass('test') and hash(tdc) == hash(TestDataClass('test'))
+    with pytest.raises(FrozenInstanceError):
+        tdc.test_variable = 'other'
+
+
+@pytest.mark.internal
+def test_frozen_dataclass_remembers_explicit_check():
+    checked = []
+
+    @dataclass(frozen=True, slots=True)
+    class TestDataClass(FrozenBaseDataclass):
+        TYPE_VALIDATOR = TypeValidator()
+
+        test_variable: str = ''
+
+    TestDataClass.TYPE_VALIDATOR.update_validators(
+        str, lambda attr_name, attr_value, exp_type: checked.append(attr_name)
+    )
+    tdc = TestDataClass('test')
+    tdc.check_properties_type(only={'test_variable'})
+    tdc.check_properties_type()
+    tdc.check_properties_type()
+    tdc.revalidate()
+
+    assert checked == ['test_variable', 'test_variable']
+
+
+@pytest.mark.internal
+@pytest.mark.parametrize('setting', ['VALIDATE_ON_ASSIGNMENT', 'TRACK_CHANGES'])
+def test_frozen_dataclass_rejects_assignment_settings(setting):
+    with pytest.raises(TypeError, match=setting):
+        type('TestDataClass', (FrozenBaseDataclass,), {setting: True})
+
+
+@pytest.mark.internal
+def test_frozen_dataclass_validation():
+    @dataclass(frozen=True)
+    class TestDataClass(FrozenStrictDataclass):
+        test_variable: int = 0
+
+        def test_variable_validator(self):
+            if self.test_variable == 13:
+                raise ValueError('test_variable could not be 13')
+
+    assert TestDataClass.from_dict({'test_variable': 1}) == TestDataClass(1)
+    with pytest.raises(ValueError):
+        TestDataClass('bad_val')
+    with pytest.raises(ValueError):
+        TestDataClass(13)
+
+
+JSON_LINES = b'''{"test_variable": 1, "tags": ["tag"]}
+
+{"test_variable": "bad_val"}
+["test_variable"]
+{"test_variable":
+{"test_variable": 2, "unknown": 1}
+{"test_variable": 3}'''
+
+
+@pytest.mark.internal
+@pytest.mark.parametrize('as_source', [
+    lambda data, tmp_path: data,
+    lambda data, tmp_path: io.BytesIO(data),
+    lambda data, tmp_path: io.StringIO(data.decode()),
+    lambda data, tmp_path: (tmp_path / 'records.jsonl').write_bytes(data) and tmp_path / 'records.jsonl',
+])
+def test_iter_validated(as_source, tmp_path):
+    records = list(iter_validated(FromDictDataClass, as_source(JSON_LINES, tmp_path)))
+
+    assert records[0] == FromDictDataClass(1, ['tag']) and records[-1] == FromDictDataClass(3)
+    assert all(isinstance(record, RecordError) for record in records[1:-1])
+    assert [record.line_number for record in records[1:-1]] == [3, 4, 5, 6]
+    assert records[1].errors[0].path == 'test_variable'
+
+
+@pytest.mark.internal
+def test_iter_validated_check_only(tmp_path):
+    path = tmp_path / 'records.jsonl'
+    path.write_bytes(JSON_LINES)
+    with open(path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        records = list(iter_validated(FromDictDataClass, mapped, decoder=json.loads, build=False))
+
+    assert [record.line_number for record in records] == [3, 4, 5, 6]
+    assert records[-1].errors == ["FromDictDataClass has no params: ['unknown']"]
+
+
+@pytest.mark.internal
+def test_iter_validated_missing_params():
+    records = list(iter_validated(FromDictDataClass, b'{"tags": ["tag"]}', build=False))
+
+    assert [record.errors for record in records] == [["Required params of FromDictDataClass are missing: ['test_variable']"]]
+
+
+@pytest.mark.internal
+def test_iter_validated_unsupported_source():
+    with pytest.raises(TypeError, match='memoryview'):
+        list(iter_validated(FromDictDataClass, memoryview(JSON_LINES)))
+
+
+@pytest.mark.internal
+def test_values_cache():
+    checked = []
+
+    @dataclass
+    class TestDataClass:
+        test_variable: tuple[str, ...] = ('a', 'b')
+        other_variable: Annotated[int, ValueRange(0, 5)] = 1
+
+    checker = TypeValidator(values_cache_size=2)
+    checker.update_validators(tuple, lambda attr_name, attr_value, exp_type: checked.append(attr_value))
+    reference = ('a', 'b')
+    for _ in range(3):
+        assert checker.check_types(TestDataClass(reference))[0] is True
+    checker.check_types(TestDataClass(tuple(['a', 'b'])))  # Equal, but other object.
+
+    assert checked == [reference]
+    assert checker.values_cache.stats() == {'hits': 6, 'misses': 2, 'size': 2, 'maxsize': 2}
+
+    # Invalid values and values of other types aren't cached.
+    assert checker.check_types(TestDataClass(other_variable=6))[0] is False
+    assert checker.check_types(TestDataClass(other_variable=6))[0] is False
+    assert checker.check_types(TestDataClass(other_variable=True))[0] is True
+
+
+@pytest.mark.internal
+def test_values_cache_not_stale():
+    @dataclass
+    class TestDataClass:
+        test_variable: tuple[list[int], ...] = ()
+        other_variable: tuple[int, ...] = ()
+
+    checker = TypeValidator(values_cache_size=10)
+    value = ([1],)
+    assert checker.check_types(TestDataClass(value))[0] is True
+    value[0].append('bad')
+
+    assert checker.check_types(TestDataClass(value))[0] is False
+    # Equal values with entries of other types aren't skipped: `(1,) == (1.0,)`.
+    assert checker.check_types(TestDataClass(other_variable=(1,)))[0] is True
+    assert checker.check_types(TestDataClass(other_variable=(1.0,)))[0] is False
+
+
+@pytest.mark.internal
+def test_union_members_order_kept_in_errors():
+    @dataclass
+    class TestDataClass:
+        test_variable: Union[int, str] = None
+        other_variable: Union[str, int] = None
+
+    res, errors = TypeValidator().check_types(TestDataClass())
+
+    assert res is False and [str(error) for error in errors] == [
+        """Expected that attr "test_variable" would be of type "(<class 'int'>, <class 'str'>)". Value None, of type "<class 'NoneType'>" was passed.""",
+        """Expected that attr "other_variable" would be of type "(<class 'str'>, <class 'int'>)". Value None, of type "<class 'NoneType'>" was passed.""",
+    ]
+
+
+@pytest.mark.internal
+@pytest.mark.parametrize('codegen', [False, True])
+def test_forward_references_and_cycles(codegen):
+    checker = TypeValidator(codegen=codegen)
+    node = Node(Node())
+    node.child.child = node
+
+    assert checker.check_types(node) == (True, [])
+    assert [error.path for error in checker.check_types(Node(Node(5)))[1]] == ['child.child']
+
+
+@dataclass
+class UnresolvedAnnotations:
+    RATE: ClassVar['Decimal'] = None  # Imported only under `TYPE_CHECKING`.
+    test_variable: int = 1
+    child: Optional['Node'] = None
+
+
+@pytest.mark.internal
+@pytest.mark.parametrize('codegen', [False, True])
+def test_unresolved_annotations(codegen):
+    class Local:
+        pass
+
+    @dataclass
+    class TestDataClass:
+        test_variable: int = 1
+        local: 'Local' = None
+
+    checker = TypeValidator(codegen=codegen)
+
+    assert [error.path for error in checker.check_types(UnresolvedAnnotations('bad_val', Node(5)))[1]] == [
+        'test_variable', 'child.child',
+    ]
+    assert [error.path for error in checker.check_types(TestDataClass('bad_val', 'any_val'))[1]] == ['test_variable']
+
+
+@pytest.mark.internal
+def test_skip_unchanged_size():
+    @dataclass
+    class TestDataClass:
+        test_variable: Annotated[list[int], Sampling(skip_unchanged=True, unchanged_size=1)] = None
+
+    checker = TypeValidator()
+    first, second = TestDataClass([1]), TestDataClass([2])
+
+    skipped = [bool(checker.validate(tdc).sampled) for tdc in (first, first, second, first)]
+
+    assert skipped == [False, True, False, False]
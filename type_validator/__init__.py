@@ -1,3 +1,9 @@
-from .base_validator import TypeValidator
-from .validators import NotEmpty, ValueRange, LimitedLength, Options
-from .base_dataclass import BaseDataclass, StrictDataclass
+from .base_validator import TypeValidator, ValidationResult
+from .validators import NotEmpty, ValueRange, LimitedLength, Options, Sampling
+from .base_dataclass import (
+    BaseDataclass, StrictDataclass, FrozenBaseDataclass, FrozenStrictDataclass, AsyncStrictDataclass,
+)
+from .batch import BatchResult
+from .errors import ValidationError
+from .profiling import Profiler
+from .streaming import RecordError, iter_validated
@@ -1,60 +1,355 @@
-from dataclasses import dataclass, asdict, astuple
+import asyncio
+import inspect
+from collections.abc import Container, Iterable, Iterator, Mapping
+from contextvars import ContextVar
+from dataclasses import dataclass, asdict, astuple, fields
+from typing import ClassVar, Self
 
-from .base_validator import TypeValidator
+from .base_validator import TypeValidator, ValidationResult
+from .validators import Sampling
 
+# Class and kwargs of an instance being built by `from_dict`, which values are already validated.
+_prevalidated: ContextVar[tuple[type, Mapping] | None] = ContextVar('_prevalidated', default=None)
 
-@dataclass
-class BaseDataclass:
-    """Extension class, that add ability to a dataclass to verify own properties values."""
 
-    TYPE_VALIDATOR = TypeValidator()
-    ENFORCE_VALIDATION = False
+class _ValidationMixin:
+    """Validation functionality of base dataclasses. Not a dataclass: frozen and mutable dataclasses can't be mixed.
+
+    Settings are class variables, so they never become fields, and don't take slots.
+    """
+
+    __slots__ = ()
+
+    TYPE_VALIDATOR: ClassVar[TypeValidator] = TypeValidator()
+    ENFORCE_VALIDATION: ClassVar[bool] = False
+    # Defaults for `check_properties_type`. See `TypeValidator.check_types`.
+    FAIL_FAST: ClassVar[bool] = False
+    MAX_ERRORS: ClassVar[int | None] = None
+    # Partial validation of collection params. See `Sampling`.
+    SAMPLING: ClassVar[Sampling | None] = None
+    # Validation of a param on every assignment, after an instance is built.
+    VALIDATE_ON_ASSIGNMENT: ClassVar[bool] = False
+    # Tracking of assigned params, to validate only them with `revalidate()`.
+    TRACK_CHANGES: ClassVar[bool] = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Assignments are intercepted only when needed. Other classes keep default (fast) `__setattr__`.
+        if (cls.VALIDATE_ON_ASSIGNMENT or cls.TRACK_CHANGES) and '__setattr__' not in cls.__dict__:
+            cls.__setattr__ = _ValidationMixin._setattr_with_validation
 
     def __post_init__(self):
         if self.ENFORCE_VALIDATION is True:
+            self._validate_on_init()
+        if self.VALIDATE_ON_ASSIGNMENT or self.TRACK_CHANGES:
+            # Marks the end of initialization. Assignments in `__init__` are validated above.
+            object.__setattr__(self, '_changed_params', set())
+
+    def _validate_on_init(self) -> None:
+        self.check_properties_type(only=self._not_prevalidated_params())
+        self.run_prop_validator_funcs()
+
+    def _setattr_with_validation(self, name: str, value) -> None:
+        changed_params = getattr(self, '_changed_params', None)
+        if changed_params is None or name not in self.TYPE_VALIDATOR.get_plan_index(self.__class__):
+            super().__setattr__(name, value)
+            return
+
+        if self.VALIDATE_ON_ASSIGNMENT:
+            result = self.TYPE_VALIDATOR.validate_mapping(
+                self.__class__, {name: value}, fail_fast=self.FAIL_FAST, max_errors=self.MAX_ERRORS
+            )
+            if result.valid is False:
+                raise ValueError(result.errors)
+            old_value = getattr(self, name)
+            super().__setattr__(name, value)
+            try:
+                self.run_prop_validator_funcs(only=(name,))
+            except Exception:
+                super().__setattr__(name, old_value)
+                raise
+            return
+
+        super().__setattr__(name, value)
+        changed_params.add(name)
+
+    def revalidate(self) -> None:
+        """Validate params assigned since the last validation. All params are validated, if `TRACK_CHANGES` is off."""
+        changed_params = getattr(self, '_changed_params', None) if self.TRACK_CHANGES else None
+        if changed_params is None:
             self.check_properties_type()
             self.run_prop_validator_funcs()
+            return
+
+        if not changed_params:
+            return
+        only = tuple(changed_params)
+        self.check_properties_type(only=only)
+        self.run_prop_validator_funcs(only=only)
+        changed_params.difference_update(only)
+
+    def _not_prevalidated_params(self) -> list[str] | None:
+        """Params, which weren't validated by `from_dict` before building an instance. None - all of them."""
+        prevalidated = _prevalidated.get()
+        if prevalidated is None or prevalidated[0] is not self.__class__:
+            return None
 
-    def check_properties_type(self) -> None:
-        """Validate all properties against it annotation type."""
-        res, errors = self.TYPE_VALIDATOR.check_types(self)
-        if res is False:
-            raise ValueError(errors)
+        kwargs = prevalidated[1]
+        return [
+            param.name for param in fields(self)
+            if param.name not in kwargs or getattr(self, param.name) is not kwargs[param.name]
+        ]
 
-    def run_prop_validator_funcs(self) -> None:
+    def check_properties_type(
+            self, fail_fast: bool | None = None, max_errors: int | None = None, only: Container[str] | None = None
+    ) -> None:
+        """Validate all properties against it annotation type.
+
+        `fail_fast` and `max_errors` default to `FAIL_FAST` and `MAX_ERRORS` of a class.
+        `only` limits validation to listed properties.
+        """
+        result = self.TYPE_VALIDATOR.validate(
+            self,
+            fail_fast=self.FAIL_FAST if fail_fast is None else fail_fast,
+            max_errors=self.MAX_ERRORS if max_errors is None else max_errors,
+            only=only,
+        )
+        if result.valid is False:
+            raise ValueError(result.errors)
+
+    def run_prop_validator_funcs(self, only: Iterable[str] | None = None) -> None:
         """Execute all custom validators
 
         Validators should be defined as follows: `def <param_name>_validator(self) -> None:...`
         Also, user should define how he want to handle an errors. Raise, or store it somewhere for a while.
+        `only` limits execution to validators of listed params.
         """
-        for param in self.as_dict():
-            validator_func = getattr(self, f'{param}_validator', None)
-            validator_func()
+        for param_name in (param.name for param in fields(self)) if only is None else only:
+            validator_func = getattr(self, f'{param_name}_validator', None)
+            if validator_func is not None:
+                res = validator_func()
+                if inspect.isawaitable(res):
+                    if inspect.iscoroutine(res):
+                        res.close()
+                    raise TypeError(
+                        f'"{param_name}_validator" is async. Use `arun_prop_validator_funcs` to execute it.'
+                    )
+
+    async def acheck_properties_type(
+            self, fail_fast: bool | None = None, max_errors: int | None = None, concurrency: int | None = None
+    ) -> None:
+        """Validate all properties against it annotation type, awaiting async validators. See `check_properties_type`."""
+        result = await self.TYPE_VALIDATOR.avalidate(
+            self,
+            fail_fast=self.FAIL_FAST if fail_fast is None else fail_fast,
+            max_errors=self.MAX_ERRORS if max_errors is None else max_errors,
+            concurrency=concurrency,
+        )
+        if result.valid is False:
+            raise ValueError(result.errors)
+
+    async def arun_prop_validator_funcs(self, concurrency: int | None = None, only_async: bool = False) -> None:
+        """Execute all custom validators. Validators may be defined as `async def <param_name>_validator(self)`.
+
+        Sync validators are executed immediately, async ones concurrently, at most `concurrency` at once.
+        `only_async=True` skips sync validators: e.g. they were already executed on initialization.
+        """
+        semaphore = asyncio.Semaphore(concurrency) if concurrency else None
+
+        async def run_validator(awaitable):
+            if semaphore is None:
+                return await awaitable
+            async with semaphore:
+                return await awaitable
+
+        awaitables = []
+        for param in fields(self):
+            validator_func = getattr(self, f'{param.name}_validator', None)
+            if validator_func is None or only_async and not inspect.iscoroutinefunction(validator_func):
+                continue
+            res = validator_func()
+            if inspect.isawaitable(res):
+                awaitables.append(run_validator(res))
+        await asyncio.gather(*awaitables)
 
-    # TODO add tests for a method.
     def dict2object(self, kwargs: dict) -> None:
         """Parse dict into an instance params.
 
         Dict keys should be exact the same, as instance params.
         if self.ENFORCE_VALIDATION is True -> will run full verification of a properties.
         """
+        self._verify_params(kwargs)
         for param, value in kwargs.items():
-            getattr(self, param)  # Verify that class has required param.
             setattr(self, param, value)
 
         if self.ENFORCE_VALIDATION is True:
             self.check_properties_type()
             self.run_prop_validator_funcs()
 
+    @classmethod
+    def from_dict(cls, kwargs: Mapping) -> Self:
+        """Build an instance from dict.
+
+        Dict keys should be exact the same, as instance params.
+        if cls.ENFORCE_VALIDATION is True -> raw values are validated before an instance is built,
+            and aren't validated again during initialization.
+        """
+        cls._verify_params(kwargs)
+        if cls.ENFORCE_VALIDATION is not True:
+            return cls(**kwargs)
+
+        result = cls.TYPE_VALIDATOR.validate_mapping(cls, kwargs, fail_fast=cls.FAIL_FAST, max_errors=cls.MAX_ERRORS)
+        if result.valid is False:
+            raise ValueError(result.errors)
+
+        token = _prevalidated.set((cls, kwargs))
+        try:
+            return cls(**kwargs)
+        finally:
+            _prevalidated.reset(token)
+
+    @classmethod
+    def from_dicts(cls, rows: Iterable[Mapping]) -> Iterator[Self]:
+        """Lazily build instances from dicts. See `from_dict`. Rows are consumed one by one, as instances are taken."""
+        for row in rows:
+            yield cls.from_dict(row)
+
+    @classmethod
+    def _verify_params(cls, kwargs: Mapping) -> None:
+        """Verify that class has all params from kwargs."""
+        param_names = cls.__dict__.get('__param_names__')
+        if param_names is None:
+            param_names = frozenset(param.name for param in fields(cls))
+            setattr(cls, '__param_names__', param_names)
+
+        unknown_params = kwargs.keys() - param_names
+        if unknown_params:
+            raise AttributeError(f'{cls.__name__} has no params: {sorted(unknown_params)}')
+
     def as_dict(self) -> dict:
+        """Deep copy of an instance as dict. Not used by validation, to avoid copying of big containers."""
         return asdict(self)
 
     def as_tuple(self) -> tuple:
+        """Deep copy of an instance as tuple. Not used by validation, to avoid copying of big containers."""
         return astuple(self)
 
 
+@dataclass
+class BaseDataclass(_ValidationMixin):
+    """Extension class, that add ability to a dataclass to verify own properties values.
+
+    Subclasses could be slotted: `@dataclass(slots=True)`. Slot for tracking of changed params is reserved here.
+    """
+
+    __slots__ = ('_changed_params',)
+
+
 @dataclass
 class StrictDataclass(BaseDataclass):
     """Extension class, that enforce dataclass validation of own properties values."""
 
+    __slots__ = ()
+
+    ENFORCE_VALIDATION = True
+
+
+@dataclass(frozen=True)
+class FrozenBaseDataclass(_ValidationMixin):
+    """Frozen variant of `BaseDataclass`. Subclasses should be frozen too: `@dataclass(frozen=True, slots=True)`.
+
+    Params can't be reassigned, so a successful validation (on initialization or by `revalidate`) is remembered:
+        next checks of an instance are skipped.
+        Entries of mutable containers aren't rechecked, after they were changed in place.
+    """
+
+    __slots__ = ('_validated',)
+
+    def __init_subclass__(cls, **kwargs):
+        # Params of frozen instances can't be assigned: there is nothing to validate or to track.
+        if cls.VALIDATE_ON_ASSIGNMENT or cls.TRACK_CHANGES:
+            raise TypeError(
+                f'{cls.__name__} is frozen: VALIDATE_ON_ASSIGNMENT and TRACK_CHANGES are not supported.'
+            )
+        super().__init_subclass__(**kwargs)
+
+    def __post_init__(self):
+        super().__post_init__()
+        if self.ENFORCE_VALIDATION is True:
+            object.__setattr__(self, '_validated', True)
+
+    def check_properties_type(
+            self, fail_fast: bool | None = None, max_errors: int | None = None, only: Container[str] | None = None
+    ) -> None:
+        if getattr(self, '_validated', False):
+            return
+        super().check_properties_type(fail_fast, max_errors, only)
+        if only is None:
+            object.__setattr__(self, '_validated', True)
+
+    def revalidate(self) -> None:
+        """Validate all params, and remember a success. See `BaseDataclass.revalidate`."""
+        if getattr(self, '_validated', False):
+            return
+        super().revalidate()
+        object.__setattr__(self, '_validated', True)
+
+
+@dataclass(frozen=True)
+class FrozenStrictDataclass(FrozenBaseDataclass):
+    """Frozen variant of `StrictDataclass`."""
+
+    __slots__ = ()
+
     ENFORCE_VALIDATION = True
+
+
+@dataclass
+class AsyncStrictDataclass(BaseDataclass):
+    """Extension class, that enforce validation of own properties values with async validators.
+
+    Type checks and sync validators are executed on initialization, like in `StrictDataclass`.
+    `__post_init__` can't be awaited, so async validators (of types and `async def <param_name>_validator`)
+        are executed only when an instance is built with `await <cls>.create(...)`.
+    Instances built directly (`<cls>(...)`, `from_dict`, `dataclasses.replace`) are NOT validated by async
+        validators: they could hold values, which async validators reject. Use `create` for untrusted values.
+    """
+
+    __slots__ = ('_pending_checks',)
+
+    ENFORCE_VALIDATION = True
+    # Max number of async validators executed at once. None - unlimited.
+    ASYNC_CONCURRENCY = 100
+
+    def _validate_on_init(self) -> None:
+        result = self.TYPE_VALIDATOR.validate_deferred(
+            self, self.FAIL_FAST, self.MAX_ERRORS, only=self._not_prevalidated_params()
+        )
+        if result.valid is False:
+            raise ValueError(result.errors)
+        for param in fields(self):
+            validator_func = getattr(self, f'{param.name}_validator', None)
+            if validator_func is not None and not inspect.iscoroutinefunction(validator_func):
+                validator_func()
+        # Only checks left for `create` are kept: `(<attr_name>, <attr_value>, <exp_type>, <validator>)`.
+        object.__setattr__(self, '_pending_checks', tuple(result.pending) or None)
+
+    @classmethod
+    def from_dict(cls, kwargs: Mapping) -> Self:
+        """Build an instance from dict. Values are validated on initialization. See `create` for async validators."""
+        cls._verify_params(kwargs)
+        return cls(**kwargs)
+
+    @classmethod
+    async def create(cls, *args, **kwargs) -> Self:
+        """Build an instance and validate it, awaiting async validators. Raise ValueError on type errors."""
+        instance = cls(*args, **kwargs)
+        pending = instance._pending_checks
+        if pending is not None:
+            object.__setattr__(instance, '_pending_checks', None)
+            result = ValidationResult(1 if cls.FAIL_FAST else cls.MAX_ERRORS, pending=list(pending))
+            result = await cls.TYPE_VALIDATOR.await_pending(result, cls.ASYNC_CONCURRENCY)
+            if result.valid is False:
+                raise ValueError(result.errors)
+        await instance.arun_prop_validator_funcs(concurrency=cls.ASYNC_CONCURRENCY, only_async=True)
+        return instance
@@ -1,19 +1,71 @@
+import asyncio
 import inspect
-from collections.abc import Mapping, Callable
-from dataclasses import dataclass, asdict
+import sys
+import time
+from collections.abc import Mapping, Callable, Container, Iterable, Iterator, Sequence, Sized
+from contextvars import ContextVar
+from itertools import islice
+from weakref import WeakKeyDictionary
+from dataclasses import dataclass, fields, is_dataclass, Field, MISSING
 from types import UnionType
-from typing import Union, Any, Final, Annotated, Optional, get_origin, get_args
+from typing import Union, Any, Final, Annotated, Optional, get_origin, get_args, get_type_hints
+
+from . import batch, codegen, parallel
+from .caching import LRUCache
+from .errors import ValidationError
+from .profiling import Profiler
+from .validators import Sampling, ValidatorBase
+
+
+class ValidationResult:
+    """State of a single validation call. Never shared between calls, threads or asyncio tasks.
+
+    `stopped` is True, when validation was interrupted by reaching `max_errors`. Rest of params weren't checked.
+    `sampled` holds paths of collections, which were checked only partially. See `Sampling`.
+    `pending` holds checks of async validators: `(<attr_name>, <attr_value>, <exp_type>, <validator>)`.
+        It's None for synchronous validation, where async validators aren't allowed.
+    """
+
+    __slots__ = ('errors', 'max_errors', 'stopped', 'sampled', 'pending', 'visiting')
+
+    def __init__(self, max_errors: int | None = None, pending: list | None = None):
+        self.errors: list[ValidationError] = []
+        self.max_errors = max_errors
+        self.stopped: bool = False
+        self.sampled: list[str] = []
+        self.pending: list[tuple[str, Any, Any, ValidatorBase]] | None = pending
+        # Ids of nested dataclass instances on a path being checked. Guards from cyclic references.
+        self.visiting: set[int] = set()
+
+    @property
+    def valid(self) -> bool:
+        return not self.errors
+
+
+class _StopValidation(Exception):
+    """Raised from `put_error`, when result reached `max_errors`. Unwinds all checkers at once."""
+
+
+class _NoActiveResult(RuntimeError):
+    """Raised from `put_error` outside of validation. Interrupts an optimistic check of a generated function."""
+
+
+# Result of a validation in progress. Reset after every call, so nested/concurrent calls don't mix up errors.
+_current_result: ContextVar[ValidationResult | None] = ContextVar('_current_result', default=None)
+# Immutable values, which are cached by `values_cache` as is. See `_cache_successes`.
+_CACHED_SCALAR_TYPES = frozenset({str, bytes, int, float, bool, type(None)})
 
 
-# TODO Add support for following annotation types
-#  Probably need to add a recursion for checking an every param.
-#  (Need to define how to pass correct expected type. According to data nesting and annotation syntax logic.)
-# c: List[int] | set[str] = 'test'
 class TypeValidator:
-    """Validator of a dataclass properties."""
+    """Validator of a dataclass properties.
+
+    Instance holds no per-call state, so it can be shared between threads and asyncio tasks.
+    `codegen=True` validates whole instances with a function generated per dataclass. See `codegen` module.
+    `values_cache_size=N` remembers up to N successfully validated immutable param values. See `values_cache`.
+    """
 
-    def __init__(self):
-        self.errors: list = []
+    def __init__(self, checkers_cache_size: int = 1024, codegen: bool = False, values_cache_size: int = 0):
+        self.codegen = codegen
         self.validators_mapping = {
             str: self.primitives_validator,
             bool: self.primitives_validator,
@@ -32,138 +84,1133 @@ class TypeValidator:
             Annotated: self.annotated_validator,
             Optional: self.union_validator,
         }
+        # Bumped on every mapping update. Used to invalidate cached validation plans.
+        self._version: int = 0
+        # Compiled checkers of annotations. Cleared on every mapping update.
+        self._checkers = LRUCache(checkers_cache_size)
+        # Stats of checks. None - profiling is disabled. See `enable_profiling`.
+        self.profiler: Profiler | None = None
+        # Successfully validated values of params, which aren't plain types. None - caching is disabled.
+        # Annotations are keyed by id, as most of `Annotated` aren't hashable, and are referenced by cache entries,
+        #   so ids aren't reused until eviction. Strings and numbers are keyed by `(id(<annotation>), <type>, <value>)`.
+        #   Tuples and frozensets are keyed by their entries with types, and only when all entries are immutable:
+        #   a value changed in place is never skipped.
+        self.values_cache: LRUCache | None = LRUCache(values_cache_size) if values_cache_size else None
+        # Function generated for a last validated dataclass: `(<dataclass>, <version>, <function>)`. See `validate`.
+        self._last_generated: tuple | None = None
 
-    def check_types(self, cls: dataclass) -> tuple[bool, list[str]]:
+    def __getstate__(self) -> dict:
+        # Compiled checkers are closures, which can't be pickled. They are recompiled by a receiver.
+        state = self.__dict__.copy()
+        state['_checkers'] = LRUCache(self._checkers.maxsize)
+        state['_last_generated'] = None
+        if self.values_cache is not None:
+            state['values_cache'] = LRUCache(self.values_cache.maxsize)
+        return state
+
+    def check_types(
+            self, cls: dataclass, fail_fast: bool = False, max_errors: int | None = None
+    ) -> tuple[bool, list[ValidationError]]:
         """Validate dataclass against params annotation.
 
-        Method iterates over all params, and apply needed verification from `self.validators_mapping`.
+        Method iterates over the compiled validation plan of a dataclass (see `get_plan`),
+            and apply the checker resolved from `self.validators_mapping` for every param.
         This validation can be updated/extended by instancing class,
             and calling: TypeValidator().update_validators({_type: Any, validator: Callable})
+
+        `fail_fast=True` stops validation on a first error. Same as `max_errors=1`.
+        `max_errors=N` stops validation, when N errors are collected. Also interrupts loops over collection entries.
+        """
+        if self.codegen and self.profiler is None and self._passes_inlined(cls):
+            return True, []
+        result = self.validate(cls, fail_fast, max_errors)
+        return result.valid, result.errors
+
+    def validate(
+            self, cls: dataclass, fail_fast: bool = False, max_errors: int | None = None,
+            only: Container[str] | None = None,
+    ) -> ValidationResult:
+        """Validate dataclass against params annotation. Same as `check_types`, but returns a whole result.
+
+        `only` limits validation to listed params.
+        """
+        validate_function = plan = None
+        if only is None and self.codegen and self.profiler is None:
+            if self._passes_inlined(cls):
+                return ValidationResult(1 if fail_fast else max_errors)
+            validate_function = self.get_validate_function(cls.__class__)
+        elif only is None:
+            plan = self.get_plan(cls.__class__)
+        else:
+            plan_index = self.get_plan_index(cls.__class__)
+            plan = [(attr_name, plan_index[attr_name]) for attr_name in only if attr_name in plan_index]
+
+        result = ValidationResult(1 if fail_fast else max_errors)
+        self._check_into(result, cls, validate_function, plan)
+        return result
+
+    def _passes_inlined(self, cls: dataclass) -> bool:
+        """Optimistic check of an instance by a generated function, which checks all params inline.
+
+        Such function reads a result of a call only to put an error. Most of instances are valid, so it's called
+            without a result: setup of a result is skipped. False - instance is invalid, or function isn't inlined,
+            and it should be validated as usual.
+        """
+        validate_function = self.get_validate_function(cls.__class__)
+        if not validate_function.inlined or _current_result.get() is not None:
+            return False
+        try:
+            validate_function(cls)
+        except _NoActiveResult:
+            return False
+        return True
+
+    def _check_into(self, result: ValidationResult, cls: dataclass, validate_function: Callable | None, plan) -> None:
+        token = _current_result.set(result)
+        try:
+            if validate_function is not None:
+                validate_function(cls)
+            else:
+                # Values are read straight from the instance. `asdict` would deep-copy every container just to read it.
+                for attr_name, checker in plan:
+                    checker(attr_name, getattr(cls, attr_name))
+        except _StopValidation:
+            result.stopped = True
+        finally:
+            _current_result.reset(token)
+
+    async def acheck_types(
+            self, cls: dataclass, fail_fast: bool = False, max_errors: int | None = None,
+            concurrency: int | None = None,
+    ) -> tuple[bool, list[ValidationError]]:
+        """Validate dataclass against params annotation, awaiting async validators. See `check_types`."""
+        result = await self.avalidate(cls, fail_fast, max_errors, concurrency)
+        return result.valid, result.errors
+
+    async def avalidate(
+            self, cls: dataclass, fail_fast: bool = False, max_errors: int | None = None,
+            concurrency: int | None = None,
+    ) -> ValidationResult:
+        """Validate dataclass against params annotation, awaiting async validators. See `validate`.
+
+        Type checks and sync validators are executed synchronously first. Then validators with `async def validate`
+            are executed concurrently, at most `concurrency` at once (unlimited by default).
+        Async validators are executed only for values, which passed type check.
+        """
+        return await self.await_pending(self.validate_deferred(cls, fail_fast, max_errors), concurrency)
+
+    def validate_deferred(
+            self, cls: dataclass, fail_fast: bool = False, max_errors: int | None = None,
+            only: Container[str] | None = None,
+    ) -> ValidationResult:
+        """Synchronous part of `avalidate`. Checks of async validators are left in `result.pending`.
+
+        Pass a result to `await_pending` to finish validation. `only` limits validation to listed params.
+        """
+        if only is None:
+            plan = self.get_plan(cls.__class__)
+        else:
+            plan_index = self.get_plan_index(cls.__class__)
+            plan = [(attr_name, plan_index[attr_name]) for attr_name in only if attr_name in plan_index]
+        result = ValidationResult(1 if fail_fast else max_errors, pending=[])
+        self._check_into(result, cls, None, plan)
+        return result
+
+    async def await_pending(self, result: ValidationResult, concurrency: int | None = None) -> ValidationResult:
+        """Execute checks of async validators left by `validate_deferred`, at most `concurrency` at once."""
+        pending, result.pending = result.pending or [], []
+        if result.stopped or not pending:
+            return result
+
+        semaphore = asyncio.Semaphore(concurrency) if concurrency else None
+
+        async def run_validator(validator: ValidatorBase, attr_value) -> tuple[bool, str]:
+            if semaphore is None:
+                return await validator.validate(attr_value)
+            async with semaphore:
+                return await validator.validate(attr_value)
+
+        outcomes = await asyncio.gather(*(
+            run_validator(validator, attr_value) for _, attr_value, _, validator in pending
+        ))
+        for (attr_name, attr_value, exp_type, _), (res, error) in zip(pending, outcomes):
+            if res is False:
+                # Message is already built by validator. Its `describe` is a coroutine, so it isn't referenced.
+                result.errors.append(ValidationError(attr_name, attr_value, exp_type, extra_msg=error))
+                if result.max_errors is not None and len(result.errors) >= result.max_errors:
+                    result.stopped = True
+                    break
+        return result
+
+    def validate_mapping(
+            self, cls: type, data: Mapping[str, Any], fail_fast: bool = False, max_errors: int | None = None
+    ) -> ValidationResult:
+        """Validate raw values of dataclass params, before an instance is built: `{<param_name>: <value>}`.
+
+        Params missing in `data` are skipped. Keys, which aren't params of a dataclass, are ignored.
+        """
+        plan_index = self.get_plan_index(cls)
+        result = ValidationResult(1 if fail_fast else max_errors)
+        token = _current_result.set(result)
+        try:
+            for attr_name, attr_value in data.items():
+                checker = plan_index.get(attr_name)
+                if checker is not None:
+                    checker(attr_name, attr_value)
+        except _StopValidation:
+            result.stopped = True
+        finally:
+            _current_result.reset(token)
+        return result
+
+    def check_params(self, cls: type, data: Mapping[str, Any]) -> list[str]:
+        """Errors of raw values keys, which `validate_mapping` doesn't check: unknown and missing required params.
+
+        The same keys would be rejected by `cls(**data)`.
+        """
+        param_names, required_names = self._get_cached(cls, '__type_validator_params__', lambda _, dtcls: (
+            frozenset(param.name for param in fields(dtcls) if param.init),
+            frozenset(param.name for param in fields(dtcls) if param.init and _is_required(param)),
+        ))
+        errors = []
+        unknown = data.keys() - param_names
+        if unknown:
+            errors.append(f'{cls.__name__} has no params: {sorted(unknown)}')
+        missing = required_names - data.keys()
+        if missing:
+            errors.append(f'Required params of {cls.__name__} are missing: {sorted(missing)}')
+        return errors
+
+    @property
+    def errors(self) -> list:
+        """Errors of a validation in progress, within current thread/task. Empty list outside of validation."""
+        result = _current_result.get()
+        return [] if result is None else result.errors
+
+    def get_plan(self, dtcls: type) -> tuple[tuple[str, Callable], ...]:
+        """Return validation plan of a dataclass: `((<param_name>, <checker>), ...)`.
+
+        Plan is compiled on a first use and cached on the dataclass itself, per validator instance.
+        It's rebuilt only when `update_validators` changes the mapping. Validators with default settings share plans,
+            so `TypeValidator().check_types(<instance>)` doesn't compile a plan on every call.
+        """
+        return self._get_cached(
+            dtcls, '__type_validator_plan__', lambda validator, _dtcls: validator.compile_plan(_dtcls)
+        )
+
+    def get_plan_index(self, dtcls: type) -> dict[str, Callable]:
+        """Return checkers of a validation plan by param names: `{<param_name>: <checker>}`."""
+        return self._get_cached(
+            dtcls, '__type_validator_plan_index__', lambda validator, _dtcls: dict(validator.get_plan(_dtcls))
+        )
+
+    def get_validate_function(self, dtcls: type) -> Callable[[Any], None]:
+        """Return function generated for a dataclass: `_validate(<instance>) -> None`. Cached like a plan."""
+        # Lookup of a function is a noticeable part of a validation call: a function of a last dataclass is remembered.
+        last = self._last_generated
+        if last is not None and last[0] is dtcls and last[1] == self._version:
+            return last[2]
+        validate_function = self._get_cached(dtcls, '__type_validator_validate__', codegen.compile_validate_function)
+        self._last_generated = (dtcls, self._version, validate_function)
+        return validate_function
+
+    def get_column_plan(self, dtcls: type) -> tuple[batch.ColumnFilter | None, ...]:
+        """Return column filters of a dataclass params, in the same order as `get_plan`.
+
+        `None` means that param has no column-wise fast path, and every value goes through a regular checker.
+        """
+        return self._get_cached(
+            dtcls, '__type_validator_column_plan__', lambda validator, _dtcls: validator.compile_column_plan(_dtcls)
+        )
+
+    def _get_cached(self, dtcls: type, cache_attr: str, compile_func: Callable[['TypeValidator', type], Any]) -> Any:
+        # Compiled per validator: `{<validator>: (<version>, <compiled>)}`. Entries are dropped with validators.
+        owner = self._cache_owner()
+        cached = dtcls.__dict__.get(cache_attr)
+        if cached is None:
+            cached = WeakKeyDictionary()
+            setattr(dtcls, cache_attr, cached)
+        entry = cached.get(owner)
+        if entry is not None and entry[0] == owner._version:
+            return entry[1]
+
+        compiled = compile_func(owner, dtcls)
+        cached[owner] = (owner._version, compiled)
+        return compiled
+
+    def _cache_owner(self) -> 'TypeValidator':
+        """Validator, which compiles and owns cached plans of this one.
+
+        Validators with default mapping and caches compile the same plans: they share ones of a single module validator.
+            Plans don't depend on `codegen`.
+        """
+        if (
+                type(self) is TypeValidator and self._version == 0 and self.values_cache is None
+                and self._checkers.maxsize == _shared_type_validator._checkers.maxsize
+        ):
+            return _shared_type_validator
+        return self
+
+    def compile_plan(self, dtcls: type) -> tuple[tuple[str, Callable], ...]:
+        """Resolve annotations of all dataclass params into pre-compiled checkers.
+
+        `SAMPLING` class attribute of a dataclass is applied to all collection params. See `Sampling`.
+        """
+        sampling = getattr(dtcls, 'SAMPLING', None)
+        if self.profiler is not None:
+            return tuple(
+                (attr_name, self._compile_profiled(dtcls, attr_name, exp_type, sampling))
+                for attr_name, exp_type in self._resolve_annotations(dtcls)
+            )
+        return tuple(
+            (attr_name, self._with_values_cache(self.compile_checker(exp_type, sampling), exp_type))
+            for attr_name, exp_type in self._resolve_annotations(dtcls)
+        )
+
+    def _with_values_cache(self, checker: Callable[[str, Any], None], exp_type) -> Callable[[str, Any], None]:
+        """Wrap checker of a param to skip values, which were already validated. See `values_cache`."""
+        if self.values_cache is None or _is_plain(exp_type) or checker is _skip_check:
+            return checker  # Single `isinstance` is cheaper than a cache lookup.
+        return _cache_successes(checker, exp_type, self.values_cache)
+
+    def _compile_profiled(self, dtcls: type, attr_name: str, exp_type, sampling: Sampling | None) -> Callable:
+        """Build checker of a param, which records own stats, and stats of every validator of `Annotated`."""
+        profiler = self.profiler
+        type_validator = self._resolve_validator(exp_type)
+        compiler = self._compilers.get(getattr(type_validator, '__func__', None))
+        if compiler is TypeValidator._compile_annotated:
+            def profile_validator(validator) -> Callable[[Any], Any]:
+                stats = profiler.stats_for(dtcls.__qualname__, attr_name, type(validator).__name__)
+                return _profiled_is_valid(_validator_check(validator), stats)
+
+            checker = self._compile_annotated(exp_type, sampling, profile_validator=profile_validator)
+        else:
+            checker = self.compile_checker(exp_type, sampling)
+        checker = self._with_values_cache(checker, exp_type)
+
+        validator_name = getattr(type_validator, '__name__', type(type_validator).__name__)
+        return _profiled_check(checker, profiler.stats_for(dtcls.__qualname__, attr_name, validator_name))
+
+    def enable_profiling(self, profiler: Profiler | None = None) -> Profiler:
+        """Start to collect stats of checks. Returns profiler with stats. See `profiling` module.
+
+        Plans are recompiled with timed checkers. Function generated by `codegen` isn't used, while profiling.
+        """
+        self.profiler = Profiler() if profiler is None else profiler
+        self._version += 1
+        return self.profiler
+
+    def disable_profiling(self) -> Profiler | None:
+        """Stop to collect stats of checks. Returns profiler with collected stats."""
+        profiler, self.profiler = self.profiler, None
+        self._version += 1
+        return profiler
+
+    def compile_column_plan(self, dtcls: type) -> tuple[batch.ColumnFilter | None, ...]:
+        """Resolve annotations of all dataclass params into column filters."""
+        return tuple(self.compile_column_filter(exp_type) for _, exp_type in self._resolve_annotations(dtcls))
+
+    @staticmethod
+    def _resolve_annotations(dtcls: type) -> list[tuple[str, Any]]:
+        # Resolves postponed annotations (`from __future__ import annotations`), and nested forward references:
+        #   `Optional['Node']`.
+        try:
+            hints = get_type_hints(dtcls, include_extras=True)
+        except NameError:  # Some annotation can't be resolved. E.g. `ClassVar['Decimal']` of `TYPE_CHECKING` import.
+            return [(param.name, _resolve_param_annotation(dtcls, param)) for param in fields(dtcls)]
+        return [(param.name, hints.get(param.name, param.type)) for param in fields(dtcls)]
+
+    def compile_checker(self, exp_type, sampling: Sampling | None = None) -> Callable[[str, Any], None]:
+        """Build checker `(attr_name, attr_value) -> None` for a single annotation.
+
+        Built-in validators are compiled into closures with all annotation args resolved in advance.
+        Nested annotations are compiled recursively: `list[dict[str, tuple[int, ...]]]`, `Optional[<dataclass>]`.
+        Custom validators from `update_validators` are called as is: `validator(attr_name, attr_value, exp_type)`.
+        Checkers are memoized per annotation in a bounded cache, so every nested annotation is compiled once.
+        `sampling` limits entries checked in list/set/tuple[..., ...]/dict. Entries of nested collections aren't limited.
+        """
+        key = _annotation_key(exp_type) if sampling is None else (_annotation_key(exp_type), sampling)
+        try:
+            checker = self._checkers.get(key)
+        except TypeError:  # Unhashable annotation. E.g. `Annotated` with unhashable metadata.
+            return self._compile_checker(exp_type, sampling)
+
+        if checker is None:
+            checker = self._compile_checker(exp_type, sampling)
+            self._checkers.put(key, checker)
+        return checker
+
+    def _compile_checker(self, exp_type, sampling: Sampling | None = None) -> Callable[[str, Any], None]:
+        type_validator = self._resolve_validator(exp_type)
+        compiler = self._compilers.get(getattr(type_validator, '__func__', None))
+        if compiler is None:
+            return lambda attr_name, attr_value: type_validator(attr_name, attr_value, exp_type)
+        if sampling is None or compiler not in self._sampling_compilers:
+            return compiler(self, exp_type)
+
+        checker = compiler(self, exp_type, sampling)
+        if sampling.skip_unchanged and compiler is not TypeValidator._compile_annotated:
+            checker = _skip_unchanged(checker, sampling.unchanged_size)
+        return checker
+
+    def _resolve_validator(self, exp_type) -> Callable:
+        lookup_type = get_origin(exp_type) or exp_type
+        type_validator = self.validators_mapping.get(lookup_type)
+        if type_validator is not None:
+            return type_validator
+        if isinstance(lookup_type, type) and is_dataclass(lookup_type):
+            return self.dataclass_validator
+        return self.any_validator
+
+    def compile_column_filter(self, exp_type) -> batch.ColumnFilter | None:
+        """Build column-wise filter of possibly invalid values for a single annotation.
+
+        Fast path exists only for built-in validators of plain types, unions of them, and `Annotated` of plain type.
+        """
+        type_validator = self._resolve_validator(exp_type)
+        compiler = self._compilers.get(getattr(type_validator, '__func__', None))
+
+        if compiler is TypeValidator._compile_any:
+            return _no_suspects
+        if compiler is TypeValidator._compile_primitives and _is_plain(exp_type):
+            return batch.type_filter(exp_type)
+        if compiler is TypeValidator._compile_final:
+            exp_types = get_args(exp_type)[0]
+        elif compiler is TypeValidator._compile_union:
+            exp_types = get_args(exp_type)
+        elif compiler is TypeValidator._compile_annotated:
+            base_type, *metadata = get_args(exp_type)
+            if _is_plain(base_type) and all(
+                    isinstance(validator, ValidatorBase | Sampling) and not _is_async_validator(validator)
+                    for validator in metadata
+            ):
+                extra_validators = tuple(validator for validator in metadata if not isinstance(validator, Sampling))
+                return batch.annotated_filter(base_type, extra_validators)
+            return None
+        else:
+            return None
+
+        if all(_is_plain(_type) for _type in (exp_types if isinstance(exp_types, tuple) else (exp_types,))):
+            return batch.type_filter(exp_types)
+        return None
+
+    def check_many(self, cls: type, rows: Sequence | Mapping[str, Sequence]) -> batch.BatchResult:
+        """Validate a batch of rows against dataclass params annotation.
+
+        Rows are either a sequence of dataclass instances, or columns: `{<param_name>: <sequence of values>}`.
+        Every param is validated over a whole column at once, and only suspicious values go through a regular checker.
+        Columns of params with defaults could be omitted.
         """
-        self.errors = []
+        if isinstance(rows, Mapping):
+            columns = rows
+            lengths = {len(column) for column in columns.values()}
+            if len(lengths) > 1:
+                raise ValueError(f'All columns should be of the same length. Passed lengths: {sorted(lengths)}')
+            rows_count = lengths.pop() if lengths else 0
+            missing = {param.name for param in fields(cls) if _is_required(param)} - columns.keys()
+            if missing:
+                raise ValueError(f'Columns of required params are missing: {sorted(missing)}')
+        else:
+            rows = rows if isinstance(rows, Sequence) else list(rows)
+            columns = None
+            rows_count = len(rows)
+
+        batch_result = batch.BatchResult(rows_count)
+        result = ValidationResult()
+        token = _current_result.set(result)
+        try:
+            for (attr_name, checker), column_filter in zip(self.get_plan(cls), self.get_column_plan(cls)):
+                if columns is None:
+                    column = [getattr(row, attr_name) for row in rows]
+                elif attr_name in columns:
+                    column = columns[attr_name]
+                else:
+                    continue
+
+                suspects = range(rows_count) if column_filter is None else column_filter(column)
+                for row_index in suspects:
+                    checker(attr_name, column[row_index])
+                    if result.errors:
+                        batch_result.errors.setdefault(row_index, []).extend(result.errors)
+                        result.errors.clear()
+        finally:
+            _current_result.reset(token)
+        return batch_result
 
-        exp_types = inspect.get_annotations(cls.__class__)
-        for attr_name, attr_value in asdict(cls).items():
-            lookup_type = get_origin(exp_types[attr_name]) or exp_types[attr_name]
-            type_validator = self.validators_mapping.get(lookup_type, self.any_validator)
-            type_validator(attr_name, attr_value, exp_types[attr_name])
+    def validate_parallel(
+            self, cls: type, rows: Iterable[Mapping[str, Any]], workers: int | None = None, chunksize: int = 10_000,
+            fail_fast: bool = False, max_errors: int | None = None,
+    ) -> Iterator[parallel.RowFailure]:
+        """Validate raw rows (see `validate_mapping`) in `workers` processes. Yield `(<row_index>, [<error>, ...])`.
 
-        res: bool = not self.errors
-        return res, self.errors
+        Only invalid rows are yielded, with rendered error messages, as soon as their chunk is done.
+        Rows are sent to workers by chunks of `chunksize`. Validator and dataclass should be picklable:
+            dataclass defined at a module level, custom validators - module functions or picklable objects.
+        `fail_fast` and `max_errors` are applied to every row separately.
+        """
+        return parallel.validate_parallel(self, cls, rows, workers, chunksize, fail_fast, max_errors)
 
     def primitives_validator(self, attr_name: str, attr_value, exp_type) -> None:
-        if not isinstance(attr_value, exp_type):
-            self.put_error(attr_name, attr_value, exp_type)
+        self._base_checker(TypeValidator._compile_primitives, exp_type)(attr_name, attr_value)
 
     def final_validator(self, attr_name: str, attr_value, exp_type) -> None:
-        if not isinstance(attr_value, get_args(exp_type)[0]):
-            self.put_error(attr_name, attr_value, exp_type)
+        self._base_checker(TypeValidator._compile_final, exp_type)(attr_name, attr_value)
 
     def any_validator(self, attr_name: str, attr_value, exp_type) -> None:
         # Validation for Any not needed
         pass
 
     def union_validator(self, attr_name: str, attr_value, exp_type) -> None:
-        expected_types = get_args(exp_type)
-        self.primitives_validator(attr_name, attr_value, expected_types)
+        self._base_checker(TypeValidator._compile_union, exp_type)(attr_name, attr_value)
 
     def annotated_validator(self, attr_name: str, attr_value, exp_type) -> None:
+        self._base_checker(TypeValidator._compile_annotated, exp_type)(attr_name, attr_value)
+
+    def set_n_list_validator(self, attr_name: str, attr_value, exp_type) -> None:
+        self._base_checker(TypeValidator._compile_set_n_list, exp_type)(attr_name, attr_value)
+
+    def tuple_validator(self, attr_name: str, attr_value, exp_type) -> None:
+        self._base_checker(TypeValidator._compile_tuple, exp_type)(attr_name, attr_value)
+
+    def dict_validator(self, attr_name: str, attr_value, exp_type) -> None:
+        self._base_checker(TypeValidator._compile_dict, exp_type)(attr_name, attr_value)
+
+    def dataclass_validator(self, attr_name: str, attr_value, exp_type) -> None:
+        self._base_checker(TypeValidator._compile_dataclass, exp_type)(attr_name, attr_value)
+
+    def _base_checker(self, compiler: Callable, exp_type) -> Callable[[str, Any], None]:
+        """Checker of a built-in validator, called directly. Memoized like `compile_checker`, not compiled per call."""
+        key = (compiler, exp_type)
+        try:
+            checker = self._checkers.get(key)
+        except TypeError:  # Unhashable annotation.
+            return compiler(self, exp_type)
+
+        if checker is None:
+            checker = compiler(self, exp_type)
+            self._checkers.put(key, checker)
+        return checker
+
+    def _compile_primitives(self, exp_type) -> Callable[[str, Any], None]:
+        put_error = self.put_error
+
+        def check(attr_name: str, attr_value) -> None:
+            if not isinstance(attr_value, exp_type):
+                put_error(attr_name, attr_value, exp_type)
+
+        return check
+
+    def _compile_final(self, exp_type) -> Callable[[str, Any], None]:
+        put_error = self.put_error
+        final_type = get_args(exp_type)[0]
+
+        if not _is_plain_or_union(final_type):  # Final[list[int]]
+            return self.compile_checker(final_type)
+
+        def check(attr_name: str, attr_value) -> None:
+            if not isinstance(attr_value, final_type):
+                put_error(attr_name, attr_value, exp_type)
+
+        return check
+
+    def _compile_any(self, exp_type) -> Callable[[str, Any], None]:
+        return _skip_check
+
+    def _compile_union(self, exp_type) -> Callable[[str, Any], None]:
+        expected_types = get_args(exp_type)
+        plain, nested, any_allowed = self._split_entries(expected_types)
+
+        if any_allowed:
+            return _skip_check
+        if not nested:
+            return self._compile_primitives(expected_types)
+
+        # list[int] | set[str], Optional[<dataclass>]
+        put_error = self.put_error
+        check_entry = self._compile_entry(plain, nested)
+
+        def check(attr_name: str, attr_value) -> None:
+            if not check_entry(attr_name, attr_value):
+                put_error(attr_name, attr_value, expected_types)
+
+        return check
+
+    def _compile_annotated(
+            self, exp_type, sampling: Sampling | None = None, profile_validator: Callable | None = None,
+    ) -> Callable[[str, Any], None]:
+        put_error = self.put_error
         lookup_args = get_args(exp_type)
         base_expected_type = lookup_args[0]
-        extra_validators = lookup_args[1:]
+        # `(<validator>, <is_valid>)`. Message of a `ValidatorBase` is rendered lazily, from a validator.
+        #   Other validators only have `validate`: `(None, <validate>)`, and message is taken from its result.
+        extra_validators = tuple(
+            (
+                validator if isinstance(validator, ValidatorBase) else None,
+                _validator_check(validator) if profile_validator is None else profile_validator(validator),
+            )
+            for validator in lookup_args[1:]
+            if not isinstance(validator, Sampling) and not _is_async_validator(validator)
+        )
+        async_validators = tuple(validator for validator in lookup_args[1:] if _is_async_validator(validator))
+        # Policy of a param overrides policy of a class.
+        sampling = next((policy for policy in lookup_args[1:] if isinstance(policy, Sampling)), sampling)
 
-        if not isinstance(attr_value, base_expected_type):
-            self.put_error(attr_name, attr_value, exp_type)
-            return
+        if not _is_plain_or_union(base_expected_type):  # Annotated[list[int], NotEmpty()]
+            base_checker = self.compile_checker(base_expected_type, sampling)
 
-        for validator in extra_validators:
-            res, error = validator.validate(attr_value)
-            if res is False:
-                self.put_error(attr_name, attr_value, exp_type, extra_msg=error)
+            def check(attr_name: str, attr_value) -> None:
+                errors = _current_result.get().errors
+                errors_count = len(errors)
+                base_checker(attr_name, attr_value)
+                if len(errors) > errors_count:
+                    return
 
-    def set_n_list_validator(self, attr_name: str, attr_value, exp_type) -> None:
+                for validator, is_valid in extra_validators:
+                    if validator is None:
+                        res, error = is_valid(attr_value)
+                        if res is False:
+                            put_error(attr_name, attr_value, exp_type, extra_msg=error)
+                    elif is_valid(attr_value) is False:
+                        put_error(attr_name, attr_value, exp_type, validator=validator)
+                if async_validators:
+                    _defer(attr_name, attr_value, exp_type, async_validators)
+
+            return check
+
+        def check(attr_name: str, attr_value) -> None:
+            if not isinstance(attr_value, base_expected_type):
+                put_error(attr_name, attr_value, exp_type)
+                return
+
+            for validator, is_valid in extra_validators:
+                if validator is None:
+                    res, error = is_valid(attr_value)
+                    if res is False:
+                        put_error(attr_name, attr_value, exp_type, extra_msg=error)
+                elif is_valid(attr_value) is False:
+                    put_error(attr_name, attr_value, exp_type, validator=validator)
+            if async_validators:
+                _defer(attr_name, attr_value, exp_type, async_validators)
+
+        return check
+
+    def _compile_set_n_list(self, exp_type, sampling: Sampling | None = None) -> Callable[[str, Any], None]:
+        put_error = self.put_error
         lookup_args = get_args(exp_type) or exp_type
 
         # Means that annotation don't have specified values stored in the collection. Passed simple: list / set / ...
         if not isinstance(lookup_args, tuple):
-            self.primitives_validator(attr_name, attr_value, exp_type)
-            return
+            return self._compile_primitives(exp_type)
 
         # Get values from UnionType. Handles pipe (|) from: set[int | str | float]
-        allowed_entries = set(get_args(arg) or arg for arg in lookup_args)
+        allowed_entries, nested, any_allowed = self._split_entries(lookup_args)
 
-        if not isinstance(attr_value, list | set):
-            self.put_error(attr_name, attr_value, exp_type)
-            return
+        annotated_entries = self._annotated_entries(lookup_args)
+        if annotated_entries is not None:  # list[Annotated[int, ValueRange(0, 10)]]
+            entry_type = lookup_args[0]
+            base_type, validators = annotated_entries
+            entry_checker, = nested
 
-        if Any in allowed_entries:
-            return
+            def check(attr_name: str, attr_value) -> None:
+                if not isinstance(attr_value, list | set):
+                    put_error(attr_name, attr_value, exp_type)
+                    return
 
-        if not all(isinstance(act_val, tuple(allowed_entries)) for act_val in attr_value):
-            self.put_error(attr_name, attr_value, exp_type)
+                entries = None if sampling is None else _sample(sampling, attr_name, attr_value)
+                if entries is None:
+                    indexes, values = None, attr_value if isinstance(attr_value, list) else list(attr_value)
+                else:
+                    indexes, values = [index for index, _ in entries], [act_val for _, act_val in entries]
+                if not all(isinstance(act_val, base_type) for act_val in values):
+                    for index, act_val in enumerate(values) if indexes is None else entries:
+                        entry_checker(f'{attr_name}[{index}]', act_val)
+                    return
 
-    def tuple_validator(self, attr_name: str, attr_value, exp_type) -> None:
+                # Every validator checks all entries at once. Errors are ordered by entries, as for one by one checks.
+                failures = sorted(
+                    (i, order) for order, validator in enumerate(validators) for i in validator.validate_many(values)[1]
+                )
+                for i, order in failures:
+                    put_error(
+                        f'{attr_name}[{i if indexes is None else indexes[i]}]', values[i], entry_type,
+                        validator=validators[order],
+                    )
+
+            return check
+
+        if nested and not any_allowed:  # list[dict[str, int]]
+            check_entry = self._compile_entry(allowed_entries, nested)
+
+            def check(attr_name: str, attr_value) -> None:
+                if not isinstance(attr_value, list | set):
+                    put_error(attr_name, attr_value, exp_type)
+                    return
+
+                entries = None if sampling is None else _sample(sampling, attr_name, attr_value)
+                for index, act_val in enumerate(attr_value) if entries is None else entries:
+                    if not check_entry(f'{attr_name}[{index}]', act_val):
+                        put_error(attr_name, attr_value, exp_type)
+                        return
+
+            return check
+
+        def check(attr_name: str, attr_value) -> None:
+            if not isinstance(attr_value, list | set):
+                put_error(attr_name, attr_value, exp_type)
+                return
+
+            if any_allowed:
+                return
+
+            entries = None if sampling is None else _sample(sampling, attr_name, attr_value)
+            if entries is not None:
+                if not all(isinstance(act_val, allowed_entries) for _, act_val in entries):
+                    put_error(attr_name, attr_value, exp_type)
+                return
+
+            if not all(isinstance(act_val, allowed_entries) for act_val in attr_value):
+                put_error(attr_name, attr_value, exp_type)
+
+        return check
+
+    def _compile_tuple(self, exp_type, sampling: Sampling | None = None) -> Callable[[str, Any], None]:
+        put_error = self.put_error
         lookup_args = get_args(exp_type) or exp_type
 
         # Means that annotation don't have specified values stored in the collection. Passed simple: list / set / ...
         if not isinstance(lookup_args, tuple):  # tuple
-            self.primitives_validator(attr_name, attr_value, exp_type)
-            return
+            return self._compile_primitives(exp_type)
 
-        if not isinstance(attr_value, tuple):
-            self.put_error(attr_name, attr_value, exp_type)
-            return
+        if Ellipsis in lookup_args:  # tuple[str, ...]
+            entry_types, nested, any_allowed = self._split_entries(lookup_args[:1])
+            check_entry = self._compile_entry(entry_types, nested) if nested else None
 
-        if Ellipsis not in lookup_args:  # tuple[int, ...]
-            for act_val, exp_index_type in zip(attr_value, lookup_args, strict=False):
-                exp_index_type = get_args(exp_index_type) or exp_index_type
-                if exp_index_type == Any:
-                    continue
-                if not isinstance(act_val, exp_index_type):
-                    self.put_error(attr_name, act_val, exp_type)
-        else:  # tuple[str, int | str]
-            for act_val in attr_value:
-                if lookup_args[0] == Any:
-                    break
-                if not isinstance(act_val, lookup_args[0]):
-                    self.put_error(attr_name, act_val, exp_type)
+            def check(attr_name: str, attr_value) -> None:
+                if not isinstance(attr_value, tuple):
+                    put_error(attr_name, attr_value, exp_type)
+                    return
 
-    def dict_validator(self, attr_name: str, attr_value, exp_type) -> None:
+                if any_allowed:
+                    return
+
+                entries = None if sampling is None else _sample(sampling, attr_name, attr_value)
+                if check_entry is None:
+                    for act_val in attr_value if entries is None else (act_val for _, act_val in entries):
+                        if not isinstance(act_val, entry_types):
+                            put_error(attr_name, act_val, exp_type)
+                    return
+
+                for index, act_val in enumerate(attr_value) if entries is None else entries:  # tuple[list[int], ...]
+                    if not check_entry(f'{attr_name}[{index}]', act_val):
+                        put_error(attr_name, act_val, exp_type)
+
+            return check
+
+        # tuple[str, int | str]. `None` marks indexes annotated with Any.
+        index_entries = tuple(self._split_entries((arg,)) for arg in lookup_args)
+
+        if any(nested for _, nested, _ in index_entries):  # tuple[str, list[int]]
+            index_checks = tuple(
+                None if any_allowed else self._compile_entry(plain, nested)
+                for plain, nested, any_allowed in index_entries
+            )
+
+            def check(attr_name: str, attr_value) -> None:
+                if not isinstance(attr_value, tuple):
+                    put_error(attr_name, attr_value, exp_type)
+                    return
+
+                for index, (act_val, check_entry) in enumerate(zip(attr_value, index_checks, strict=False)):
+                    if check_entry is not None and not check_entry(f'{attr_name}[{index}]', act_val):
+                        put_error(attr_name, act_val, exp_type)
+
+            return check
+
+        index_types = tuple(None if any_allowed else plain for plain, _, any_allowed in index_entries)
+
+        def check(attr_name: str, attr_value) -> None:
+            if not isinstance(attr_value, tuple):
+                put_error(attr_name, attr_value, exp_type)
+                return
+
+            for act_val, exp_index_type in zip(attr_value, index_types, strict=False):
+                if exp_index_type is not None and not isinstance(act_val, exp_index_type):
+                    put_error(attr_name, act_val, exp_type)
+
+        return check
+
+    def _compile_dict(self, exp_type, sampling: Sampling | None = None) -> Callable[[str, Any], None]:
+        put_error = self.put_error
         origin = get_origin(exp_type)
         lookup_args = get_args(exp_type) or exp_type
 
         # Means that annotation don't have specified values stored in the collection.
         #   Passed simple: dict / Mapping / Dict
         if not isinstance(lookup_args, tuple):
-            self.primitives_validator(attr_name, attr_value, exp_type)
-            return
+            return self._compile_primitives(exp_type)
 
-        valid_keys = get_args(lookup_args[0]) or lookup_args[0]
-        valid_vals = get_args(lookup_args[1]) or lookup_args[1]
+        if (get_args(lookup_args[0]) or lookup_args[0]) == (0,):  # Mapping
+            return self._compile_primitives(exp_type)
 
-        if valid_keys == (0,):  # Mapping
-            if not isinstance(attr_value, exp_type):
-                self.put_error(attr_name, attr_value, exp_type)
-            return
+        # Types shown in error messages: single type, or tuple of union members.
+        keys_type, vals_type = (_union_members(arg) or arg for arg in lookup_args)
+        valid_keys, nested_keys, any_key = self._split_entries(lookup_args[:1])
+        valid_vals, nested_vals, any_val = self._split_entries(lookup_args[1:])
+        check_keys = not any_key
+        check_vals = not any_val
 
-        self.primitives_validator(attr_name, attr_value, origin)
-        if self.errors:
-            return
+        if (nested_keys and check_keys) or (nested_vals and check_vals):  # dict[str, list[int]]
+            check_key = self._compile_entry(valid_keys, nested_keys) if check_keys else None
+            check_val = self._compile_entry(valid_vals, nested_vals) if check_vals else None
 
-        for key, val in attr_value.items():  # dict[str, str | int]
-            if valid_keys != Any and not isinstance(key, valid_keys):
-                self.put_error(attr_name, key, valid_keys)
-            if valid_vals != Any and not isinstance(val, valid_vals):
-                self.put_error(attr_name, val, valid_vals)
-
-    def put_error(self, attr_name: str, attr_value, exp_type, extra_msg=''):
-        """Template method for adding errors"""
-        self.errors.append(
-            f'Expected that attr "{attr_name}" would be of type "{exp_type}". '
-            f'Value {attr_value}, of type "{type(attr_value)}" was passed.'
-            f'{extra_msg}'
-        )
+            def check(attr_name: str, attr_value) -> None:
+                if not isinstance(attr_value, origin):
+                    put_error(attr_name, attr_value, origin)
+                    return
+
+                entries = None if sampling is None else _sample(sampling, attr_name, attr_value.items())
+                for key, val in attr_value.items() if entries is None else (item for _, item in entries):
+                    if check_key is not None and not check_key(attr_name, key):
+                        put_error(attr_name, key, keys_type)
+                    if check_val is not None and not check_val(f'{attr_name}[{key!r}]', val):
+                        put_error(attr_name, val, vals_type)
+
+            return check
+
+        def check(attr_name: str, attr_value) -> None:
+            if not isinstance(attr_value, origin):
+                put_error(attr_name, attr_value, origin)
+                return
+
+            entries = None if sampling is None else _sample(sampling, attr_name, attr_value.items())
+            for key, val in attr_value.items() if entries is None else (item for _, item in entries):  # dict[str, int]
+                if check_keys and not isinstance(key, valid_keys):
+                    put_error(attr_name, key, keys_type)
+                if check_vals and not isinstance(val, valid_vals):
+                    put_error(attr_name, val, vals_type)
+
+        return check
+
+    def _compile_dataclass(self, exp_type) -> Callable[[str, Any], None]:
+        put_error = self.put_error
+        get_plan = self.get_plan
+        dtcls = get_origin(exp_type) or exp_type
+
+        def check(attr_name: str, attr_value) -> None:
+            if not isinstance(attr_value, dtcls):
+                put_error(attr_name, attr_value, exp_type)
+                return
+
+            # Instance, which refers to itself (`node.child = node`), is checked once.
+            visiting = _current_result.get().visiting
+            instance_id = id(attr_value)
+            if instance_id in visiting:
+                return
+
+            visiting.add(instance_id)
+            try:
+                # Plan is taken on every check: it could be a subclass, or a class that refers to itself.
+                for param_name, checker in get_plan(attr_value.__class__):
+                    checker(f'{attr_name}.{param_name}', getattr(attr_value, param_name))
+            finally:
+                visiting.discard(instance_id)
+
+        return check
+
+    def _split_entries(self, entry_types: tuple) -> tuple[tuple[type, ...], tuple[Callable, ...], bool]:
+        """Split annotations of entries into plain types and checkers of nested annotations.
+
+        Unions are flattened: `list[int | list[int]]` -> `((int, ), (<list[int] checker>, ), False)`.
+        Returns: `(<plain types>, <nested checkers>, <any entry allowed>)`
+        """
+        plain, nested = {}, {}
+        for entry_type in entry_types:
+            for alternative in _union_members(entry_type) or (entry_type,):
+                if _is_plain(alternative):
+                    plain[alternative] = None
+                    continue
+
+                checker = self.compile_checker(alternative)
+                if checker is _skip_check:  # Any
+                    return (), (), True
+                nested[checker] = None
+        return tuple(plain), tuple(nested), False
+
+    def _annotated_entries(self, entry_types: tuple) -> tuple[type, tuple[ValidatorBase, ...]] | None:
+        """Base type and validators of entries annotated as `Annotated[<plain type>, <validator>, ...]`.
+
+        None for other entries, or when entries can't be validated at once: mapping is updated, policies or async
+            validators are used.
+        """
+        if len(entry_types) != 1 or get_origin(entry_types[0]) is not Annotated:
+            return None
+        type_validator = self._resolve_validator(entry_types[0])
+        if self._compilers.get(getattr(type_validator, '__func__', None)) is not TypeValidator._compile_annotated:
+            return None
+
+        base_type, *metadata = get_args(entry_types[0])
+        if not _is_plain(base_type) or not all(
+                isinstance(validator, ValidatorBase) and not _is_async_validator(validator) for validator in metadata
+        ):
+            return None
+        return base_type, tuple(metadata)
+
+    @staticmethod
+    def _compile_entry(plain: tuple[type, ...], nested: tuple[Callable, ...]) -> Callable[[str, Any], bool]:
+        """Build check of a single entry, that has nested annotations. Returns False on invalid entry.
+
+        Single nested annotation puts own errors, with a path of an entry: `attr[0]`, `attr['key']`, `attr.param`.
+            Check returns True then, as error is already put.
+        For union of nested annotations, nested errors are ignored, and False is returned if none of them matches.
+        """
+        if len(nested) == 1:
+            checker, = nested
+
+            def check_entry(path: str, value) -> bool:
+                if not isinstance(value, plain):
+                    checker(path, value)
+                return True
+
+            return check_entry
+
+        def check_entry(path: str, value) -> bool:
+            return isinstance(value, plain) or any(_matches(checker, value) for checker in nested)
+
+        return check_entry
+
+    def put_error(self, attr_name: str, attr_value, exp_type, extra_msg='', validator=None):
+        """Template method for adding errors. Errors are stored into a result of a validation in progress.
+
+        Error message isn't rendered here. See `ValidationError`.
+        """
+        result = _current_result.get()
+        if result is None:
+            raise _NoActiveResult('put_error() could be called only during validation.')
+        result.errors.append(ValidationError(attr_name, attr_value, exp_type, validator, extra_msg))
+        if result.max_errors is not None and len(result.errors) >= result.max_errors:
+            raise _StopValidation
 
     def update_validators(self, _type: Any, validator: Callable) -> None:
-        """Extend/update existing validators in self.validators_mapping"""
+        """Extend/update existing validators in self.validators_mapping
+
+        Cached validation plans of dataclasses are invalidated, and would be recompiled on a next check.
+        """
         self.validators_mapping.update({_type: validator})
+        self._checkers.clear()
+        if self.values_cache is not None:
+            self.values_cache.clear()
+        self._version += 1
+
+    _compilers = {
+        primitives_validator: _compile_primitives,
+        final_validator: _compile_final,
+        any_validator: _compile_any,
+        union_validator: _compile_union,
+        annotated_validator: _compile_annotated,
+        set_n_list_validator: _compile_set_n_list,
+        tuple_validator: _compile_tuple,
+        dict_validator: _compile_dict,
+        dataclass_validator: _compile_dataclass,
+    }
+    # Compilers, which accept `sampling` policy.
+    _sampling_compilers = (_compile_set_n_list, _compile_tuple, _compile_dict, _compile_annotated)
+
+
+def _annotation_key(exp_type) -> Any:
+    """Key of a memoized checker. Unlike equality of annotations, order of union members is significant:
+    `Union[int, str] == Union[str, int]`, but their errors list types in a different order.
+    """
+    args = get_args(exp_type)
+    if not args:
+        return exp_type
+    return exp_type, tuple(_annotation_key(arg) for arg in args)
+
+
+def _skip_check(attr_name: str, attr_value) -> None:
+    pass
+
+
+def _matches(checker: Callable[[str, Any], None], value) -> bool:
+    """Whether value passes checker. Errors are collected aside, and don't get into a result in progress."""
+    probe = ValidationResult(max_errors=1)
+    token = _current_result.set(probe)
+    try:
+        checker('', value)
+    except _StopValidation:
+        pass
+    finally:
+        _current_result.reset(token)
+    return probe.valid
+
+
+def _validator_check(validator) -> Callable[[Any], Any]:
+    """`is_valid` of `ValidatorBase`. Other validators of `Annotated` are duck-typed: only `validate` is required."""
+    return validator.is_valid if isinstance(validator, ValidatorBase) else validator.validate
+
+
+def _is_async_validator(validator) -> bool:
+    return inspect.iscoroutinefunction(getattr(validator, 'validate', None))
+
+
+def _defer(attr_name: str, attr_value, exp_type, validators: tuple[ValidatorBase, ...]) -> None:
+    """Put checks of async validators aside, to await them after synchronous checks."""
+    pending = _current_result.get().pending
+    if pending is None:
+        raise TypeError(
+            f'Attr "{attr_name}" has async validators: {validators}. Use `acheck_types` / `avalidate` to validate it.'
+        )
+    pending.extend((attr_name, attr_value, exp_type, validator) for validator in validators)
+
+
+def _cache_successes(
+        checker: Callable[[str, Any], None], exp_type, cache: LRUCache
+) -> Callable[[str, Any], None]:
+    exp_type_id = id(exp_type)
+
+    def check(attr_name: str, attr_value) -> None:
+        value_type = type(attr_value)
+        if value_type in _CACHED_SCALAR_TYPES:
+            # Type is a part of a key: `1 == 1.0 == True`.
+            key = (exp_type_id, value_type, attr_value)
+        elif value_type is tuple or value_type is frozenset:
+            value_key = _cached_value_key(attr_value)
+            if value_key is None:
+                checker(attr_name, attr_value)
+                return
+            key = (exp_type_id, value_key)
+        else:
+            checker(attr_name, attr_value)
+            return
+
+        if cache.get(key) is not None:
+            return
+
+        result = _current_result.get()
+        counts = len(result.errors), len(result.sampled), len(result.pending or ())
+        checker(attr_name, attr_value)
+        # Partially checked values, and values waiting for async validators aren't validated yet.
+        if (len(result.errors), len(result.sampled), len(result.pending or ())) == counts:
+            cache.put(key, exp_type)
+
+    return check
+
+
+def _cached_value_key(value) -> tuple | None:
+    """Key of a tuple/frozenset, with types of all entries: `(1,) == (1.0,)`. None - value has mutable entries."""
+    value_type = type(value)
+    if value_type in _CACHED_SCALAR_TYPES:
+        return value_type, value
+    if value_type is not tuple and value_type is not frozenset:
+        return None
+
+    entries = []
+    for entry in value:
+        entry_key = _cached_value_key(entry)
+        if entry_key is None:
+            return None
+        entries.append(entry_key)
+    return value_type, value_type(entries)
+
+
+def _profiled_check(checker: Callable[[str, Any], None], stats) -> Callable[[str, Any], None]:
+    perf_counter = time.perf_counter
+
+    def check(attr_name: str, attr_value) -> None:
+        errors = _current_result.get().errors
+        errors_count = len(errors)
+        start = perf_counter()
+        try:
+            checker(attr_name, attr_value)
+        finally:
+            stats.add(perf_counter() - start, len(errors) > errors_count)
+
+    return check
+
+
+def _profiled_is_valid(is_valid: Callable[[Any], Any], stats) -> Callable[[Any], Any]:
+    """Timed `is_valid`, or `validate` of a duck-typed validator, which returns `(<res>, <message>)`."""
+    perf_counter = time.perf_counter
+
+    def profiled(value) -> Any:
+        start = perf_counter()
+        res = is_valid(value)
+        stats.add(perf_counter() - start, res is False or res.__class__ is tuple and res[0] is False)
+        return res
+
+    return profiled
+
+
+def _sample(sampling: Sampling, attr_name: str, attr_value: Sized) -> list[tuple[int, Any]] | None:
+    """Pick `(<index>, <entry>)` to check, according to policy. None, when collection should be checked fully."""
+    indexes = sampling.indexes(len(attr_value))
+    if indexes is None:
+        return None
+
+    _current_result.get().sampled.append(attr_name)
+    if isinstance(attr_value, Sequence):
+        return [(index, attr_value[index]) for index in indexes]
+    return list(enumerate(islice(attr_value, len(indexes))))
+
+
+def _skip_unchanged(checker: Callable[[str, Any], None], maxsize: int) -> Callable[[str, Any], None]:
+    """Skip checks of collections, which passed checker already, and have the same identity and length.
+
+    Checked collections are referenced from the cache. So their `id` couldn't be reused, while they are cached.
+    """
+    checked = LRUCache(maxsize)
+
+    def check(attr_name: str, attr_value) -> None:
+        size = len(attr_value) if isinstance(attr_value, Sized) else None
+        cached = checked.get(id(attr_value))
+        if cached is not None and cached[0] is attr_value and cached[1] == size:
+            _current_result.get().sampled.append(attr_name)
+            return
+
+        errors = _current_result.get().errors
+        errors_count = len(errors)
+        checker(attr_name, attr_value)
+        if len(errors) == errors_count:
+            checked.put(id(attr_value), (attr_value, size))
+
+    return check
+
+
+def _is_plain(exp_type) -> bool:
+    """Plain class, checked by a single `isinstance`. Not a generic alias, `Any` or dataclass."""
+    return isinstance(exp_type, type) and exp_type is not Any and not is_dataclass(exp_type)
+
+
+def _is_plain_or_union(exp_type) -> bool:
+    return all(_is_plain(member) for member in _union_members(exp_type) or (exp_type,))
+
+
+def _union_members(exp_type) -> tuple:
+    """Members of `Union[...]` / `X | Y`. Empty tuple for other annotations."""
+    return get_args(exp_type) if get_origin(exp_type) in (Union, UnionType) else ()
+
+
+def _no_suspects(column: Sequence) -> Iterable[int]:
+    return ()
+
+
+def _resolve_param_annotation(dtcls: type, param: Field):
+    """Annotation of a single param, resolved in a module of a class, which declares it. Any - it can't be resolved."""
+    owner = next(
+        (base for base in dtcls.__mro__ if param.name in base.__dict__.get('__annotations__', {})), dtcls
+    )
+    surrogate = type(owner.__name__, (), {'__annotations__': {param.name: param.type}})
+    module = sys.modules.get(owner.__module__)
+    try:
+        return get_type_hints(
+            surrogate, getattr(module, '__dict__', {}), dict(vars(owner)), include_extras=True
+        )[param.name]
+    except NameError:  # E.g. a local class, referenced by a string.
+        return Any
+
+
+def _is_required(param: Field) -> bool:
+    return param.default is MISSING and param.default_factory is MISSING
+
+
+# Owner of plans of all validators with default settings. See `TypeValidator._cache_owner`.
+_shared_type_validator = TypeValidator()
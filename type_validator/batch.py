@@ -0,0 +1,87 @@
+"""Column-wise helpers for batch validation: `TypeValidator.check_many`.
+
+Filters return indexes of rows, which could be invalid. Only these rows are passed through a regular
+    per-value checker, to build error messages. NumPy is used for arrays, when it's installed.
+"""
+from collections.abc import Callable, Sequence, Iterable
+
+from .validators import ValidatorBase
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+ColumnFilter = Callable[[Sequence], Iterable[int]]
+
+# Array dtype kinds, which guarantee that every array entry is an instance of a python type.
+_DTYPE_KINDS = {
+    bool: 'b',
+    int: 'biu',
+    float: 'f',
+    str: 'U',
+    bytes: 'S',
+}
+
+
+class BatchResult:
+    """Result of a batch validation. Errors are stored only for invalid rows: `{<row_index>: [<error>, ...]}`."""
+
+    __slots__ = ('rows_count', 'errors')
+
+    def __init__(self, rows_count: int):
+        self.rows_count: int = rows_count
+        self.errors: dict[int, list] = {}
+
+    @property
+    def valid(self) -> bool:
+        return not self.errors
+
+    @property
+    def failed(self) -> list[int]:
+        """Sorted indexes of invalid rows."""
+        return sorted(self.errors)
+
+    def __len__(self) -> int:
+        return self.rows_count
+
+
+def is_array(column) -> bool:
+    return np is not None and isinstance(column, np.ndarray)
+
+
+def type_filter(exp_types: type | tuple[type, ...]) -> ColumnFilter:
+    """Filter of column entries, which aren't instances of `exp_types`."""
+    kinds = ''.join(_DTYPE_KINDS.get(exp_type, '') for exp_type in (
+        exp_types if isinstance(exp_types, tuple) else (exp_types,)
+    ))
+
+    def failing(column: Sequence) -> Iterable[int]:
+        if is_array(column) and column.dtype.kind in kinds:
+            return ()
+        return [i for i, value in enumerate(column) if not isinstance(value, exp_types)]
+
+    return failing
+
+
+def annotated_filter(base_type: type, validators: tuple[ValidatorBase, ...]) -> ColumnFilter:
+    """Filter of column entries, which aren't instances of `base_type` or rejected by any of `validators`."""
+    base_filter = type_filter(base_type)
+
+    def failing(column: Sequence) -> Iterable[int]:
+        suspects = set(base_filter(column))
+        for validator in validators:
+            suspects.update(validator_failing(validator, column, suspects))
+        return sorted(suspects)
+
+    return failing
+
+
+def validator_failing(validator: ValidatorBase, column: Sequence, skip: set[int]) -> Iterable[int]:
+    """Indexes of column entries rejected by validator. Entries from `skip` aren't validated."""
+    if not skip:
+        return validator.validate_many(column)[1]
+
+    indexes = [i for i in range(len(column)) if i not in skip]
+    values = column[indexes] if is_array(column) else [column[i] for i in indexes]
+    return [indexes[i] for i in validator.validate_many(values)[1]]
@@ -0,0 +1,61 @@
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+
+class LRUCache:
+    """Bounded mapping, which evicts least recently used entries.
+
+    Doesn't take locks: every operation is a single call of a C-implemented `OrderedDict` method.
+    Concurrent access could only lose an update of LRU order, or make `hits`/`misses` slightly inaccurate.
+    `maxsize=0` disables caching.
+    """
+
+    __slots__ = ('maxsize', 'hits', 'misses', '_data')
+
+    def __init__(self, maxsize: int = 1024):
+        if maxsize < 0:
+            raise ValueError('maxsize should be >= 0.')
+        self.maxsize = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+        self._data: OrderedDict = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        try:
+            self._data.move_to_end(key)
+        except KeyError:  # Evicted concurrently.
+            pass
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        if self.maxsize == 0:
+            return
+
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            try:
+                self._data.popitem(last=False)
+            except KeyError:  # Evicted concurrently.
+                break
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.hits = self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._data), 'maxsize': self.maxsize}
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
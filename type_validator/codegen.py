@@ -0,0 +1,156 @@
+"""Code generation of a specialized validation function per dataclass.
+
+Like `dataclasses` generates `__init__`, source of `_validate(self)` is built from params annotation and compiled
+    with `exec`. Checks of plain types, unions of them, `Final`, `Annotated` of plain type and fixed-size tuples
+    are inlined. Other params call checkers from the compiled validation plan.
+"""
+from collections.abc import Callable
+from typing import Any, get_args
+
+from . import base_validator as bv
+
+
+def compile_validate_function(type_validator: 'bv.TypeValidator', dtcls: type) -> Callable[[Any], None]:
+    """Generate `_validate(self) -> None`, which puts errors the same way, as the validation plan does.
+
+    `_validate.inlined` is True, when checks of all params are inlined: only `put_error` reads a result of a call.
+    """
+    namespace = {'put_error': type_validator.put_error, 'len': len, 'isinstance': isinstance, 'tuple': tuple}
+    lines = ['def _validate(self):']
+    inlined = True
+    plan = type_validator.get_plan(dtcls)
+    sampling = getattr(dtcls, 'SAMPLING', None)
+
+    for index, ((attr_name, checker), (_, exp_type)) in enumerate(zip(plan, type_validator._resolve_annotations(dtcls))):
+        namespace[f'_attr_name{index}'] = attr_name
+        body = _inline_check(type_validator, exp_type, index, namespace, inline_tuples=sampling is None)
+        if body is None:
+            inlined = False
+            namespace[f'_checker{index}'] = checker
+            body = [f'_checker{index}({attr_name!r}, value)']
+        if body:
+            lines.append(f'    value = self.{attr_name}')
+            lines.extend(f'    {line}' for line in body)
+
+    if len(lines) == 1:
+        lines.append('    pass')
+
+    exec('\n'.join(lines), namespace)
+    validate = namespace['_validate']
+    validate.__qualname__ = f'{dtcls.__qualname__}._validate'
+    validate.inlined = inlined
+    return validate
+
+
+def _inline_check(
+        type_validator: 'bv.TypeValidator', exp_type, index: int, namespace: dict, inline_tuples: bool
+) -> list[str] | None:
+    """Source lines of an inlined check for value of a param. None, if check couldn't be inlined."""
+    type_validator_func = type_validator._resolve_validator(exp_type)
+    compiler = type_validator._compilers.get(getattr(type_validator_func, '__func__', None))
+    name = f'_attr_name{index}'  # Set by a caller.
+
+    if compiler is bv.TypeValidator._compile_any:
+        return []
+    if compiler is bv.TypeValidator._compile_primitives and bv._is_plain(exp_type):
+        namespace[f'_type{index}'] = exp_type
+        return _isinstance_lines(index, f'_type{index}', f'_type{index}', name)
+    if compiler is bv.TypeValidator._compile_union:
+        members = get_args(exp_type)
+        if not all(bv._is_plain(member) for member in members):
+            return None
+        namespace[f'_type{index}'] = members
+        return _isinstance_lines(index, f'_type{index}', f'_type{index}', name)
+    if compiler is bv.TypeValidator._compile_final:
+        final_type = get_args(exp_type)[0]
+        if not bv._is_plain_or_union(final_type):
+            return None
+        namespace[f'_type{index}'], namespace[f'_exp_type{index}'] = final_type, exp_type
+        return _isinstance_lines(index, f'_type{index}', f'_exp_type{index}', name)
+    if compiler is bv.TypeValidator._compile_annotated:
+        return _annotated_lines(exp_type, index, namespace)
+    if compiler is bv.TypeValidator._compile_tuple and inline_tuples:
+        return _tuple_lines(exp_type, index, namespace)
+    return None
+
+
+def _isinstance_lines(index: int, types_name: str, exp_type_name: str, name: str) -> list[str]:
+    return [
+        f'if not isinstance(value, {types_name}):',
+        f'    put_error({name}, value, {exp_type_name})',
+    ]
+
+
+def _annotated_lines(exp_type, index: int, namespace: dict) -> list[str] | None:
+    base_type, *metadata = get_args(exp_type)
+    if not bv._is_plain_or_union(base_type) or any(
+            isinstance(validator, bv.Sampling) or bv._is_async_validator(validator) for validator in metadata
+    ):
+        return None
+
+    namespace[f'_type{index}'], namespace[f'_exp_type{index}'] = base_type, exp_type
+    lines = [
+        f'if not isinstance(value, _type{index}):',
+        f'    put_error(_attr_name{index}, value, _exp_type{index})',
+        'else:',
+    ]
+    for validator_index, validator in enumerate(metadata):
+        validator_name = f'_validator{index}_{validator_index}'
+        if not isinstance(validator, bv.ValidatorBase):  # Duck-typed: message is taken from `validate` result.
+            namespace[validator_name] = validator.validate
+            lines += [
+                f'    res, error = {validator_name}(value)',
+                '    if res is False:',
+                f'        put_error(_attr_name{index}, value, _exp_type{index}, extra_msg=error)',
+            ]
+            continue
+
+        namespace[validator_name] = validator
+        namespace[f'_is_valid{index}_{validator_index}'] = validator.is_valid
+        lines += [
+            f'    if _is_valid{index}_{validator_index}(value) is False:',
+            f'        put_error(_attr_name{index}, value, _exp_type{index}, validator={validator_name})',
+        ]
+    if not metadata:
+        lines.append('    pass')
+    return lines
+
+
+def _tuple_lines(exp_type, index: int, namespace: dict) -> list[str] | None:
+    lookup_args = get_args(exp_type)
+    if not lookup_args:  # tuple
+        namespace[f'_type{index}'] = exp_type
+        return _isinstance_lines(index, f'_type{index}', f'_type{index}', f'_attr_name{index}')
+    if Ellipsis in lookup_args:
+        return None
+
+    index_types = []
+    for arg in lookup_args:
+        members = bv._union_members(arg) or (arg,)
+        if arg is Any or Any in members:
+            index_types.append(None)
+        elif all(bv._is_plain(member) for member in members):
+            index_types.append(members)
+        else:
+            return None
+
+    namespace[f'_exp_type{index}'] = exp_type
+    lines = [
+        'if not isinstance(value, tuple):',
+        f'    put_error(_attr_name{index}, value, _exp_type{index})',
+        'else:',
+        '    size = len(value)',
+    ]
+    # Unrolled check of every index. Like `zip(..., strict=False)`: missing entries aren't checked.
+    for entry_index, entry_types in enumerate(index_types):
+        if entry_types is None:
+            continue
+        types_name = f'_type{index}_{entry_index}'
+        namespace[types_name] = entry_types
+        lines += [
+            f'    if size > {entry_index} and not isinstance(value[{entry_index}], {types_name}):',
+            f'        put_error(_attr_name{index}, value[{entry_index}], _exp_type{index})',
+        ]
+    if len(lines) == 4:
+        lines.append('    pass')
+    return lines
@@ -0,0 +1,63 @@
+import reprlib
+from typing import Any
+
+_CONTAINERS = (list, tuple, set, frozenset, dict)
+
+
+class ValidationError:
+    """Error of a single check. Message is rendered only on demand, from references to checked value and validator.
+
+    For backward compatibility error is equal to own message, and its repr is a repr of own message.
+    Set `ValidationError.max_value_length` to truncate rendered values. Disabled by default.
+    """
+
+    __slots__ = ('path', 'exp_type', 'value', 'validator', 'extra_msg')
+
+    max_value_length: int | None = None
+
+    def __init__(self, path: str, value: Any, exp_type: Any, validator=None, extra_msg: str = ''):
+        self.path = path
+        self.value = value
+        self.exp_type = exp_type
+        self.validator = validator
+        self.extra_msg = extra_msg
+
+    @property
+    def message(self) -> str:
+        extra_msg = self.extra_msg if self.validator is None else self.validator.describe(self.value)
+        return (
+            f'Expected that attr "{self.path}" would be of type "{self.exp_type}". '
+            f'Value {format_value(self.value)}, of type "{type(self.value)}" was passed.'
+            f'{extra_msg}'
+        )
+
+    def __str__(self) -> str:
+        return self.message
+
+    def __repr__(self) -> str:
+        return repr(self.message)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, str):
+            return self.message == other
+        if isinstance(other, ValidationError):
+            return self.message == other.message
+        return NotImplemented
+
+    __hash__ = None
+
+
+def format_value(value: Any) -> str:
+    """Value as it's shown in error messages. Truncated according to `ValidationError.max_value_length`."""
+    limit = ValidationError.max_value_length
+    if limit is None:
+        return f'{value}'
+
+    if isinstance(value, _CONTAINERS):
+        # Avoid rendering of a whole container, just to cut it afterward. Repr of built-in containers == str.
+        short_repr = reprlib.Repr()
+        short_repr.maxstring = short_repr.maxother = short_repr.maxlong = limit
+        text = short_repr.repr(value)
+    else:
+        text = f'{value}'
+    return text if len(text) <= limit else f'{text[:limit]}...'
@@ -0,0 +1,76 @@
+"""Multiprocess validation of raw rows: `TypeValidator.validate_parallel`.
+
+Checkers are pure Python, so threads don't speed validation up. Rows are split into chunks and validated
+    in worker processes. A validator and a dataclass are sent to every worker once, on its start,
+    and a plan is compiled there once. Tasks carry only rows, and results carry only failures.
+"""
+import os
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from itertools import islice
+
+# Failure of a row: `(<row_index>, [<error message>, ...])`.
+RowFailure = tuple[int, list[str]]
+
+# Validator, dataclass and validation options of a worker process. Set by `_init_worker`.
+_worker_state: tuple | None = None
+
+
+def validate_parallel(
+        type_validator, cls: type, rows: Iterable[Mapping], workers: int | None = None, chunksize: int = 10_000,
+        fail_fast: bool = False, max_errors: int | None = None,
+) -> Iterator[RowFailure]:
+    """Validate raw rows in worker processes. Yield failures, as soon as their chunks are done.
+
+    Chunks are finished in arbitrary order, so failures aren't sorted by a row index.
+    At most `2 * workers` chunks are in flight, so `rows` could be a lazy iterable of any size.
+    """
+    if chunksize < 1:
+        raise ValueError('chunksize should be >= 1.')
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(type_validator, cls, fail_fast, max_errors)
+    ) as executor:
+        max_in_flight = 2 * workers
+        in_flight: set[Future] = set()
+        rows = iter(rows)
+        start = 0
+        while True:
+            while len(in_flight) < max_in_flight:
+                chunk = list(islice(rows, chunksize))
+                if not chunk:
+                    break
+                in_flight.add(executor.submit(_validate_chunk, start, chunk))
+                start += len(chunk)
+            if not in_flight:
+                return
+
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+
+
+def _init_worker(type_validator, cls: type, fail_fast: bool, max_errors: int | None) -> None:
+    global _worker_state
+    type_validator.get_plan_index(cls)
+    _worker_state = (type_validator, cls, fail_fast, max_errors)
+
+
+def _validate_chunk(start: int, rows: list[Mapping]) -> list[RowFailure]:
+    type_validator, cls, fail_fast, max_errors = _worker_state
+    validate_mapping = type_validator.validate_mapping
+    failures = []
+    check_params = type_validator.check_params
+    for row_index, row in enumerate(rows, start):
+        errors = check_params(cls, row)
+        if errors and fail_fast:
+            failures.append((row_index, errors[:1]))
+            continue
+
+        result = validate_mapping(cls, row, fail_fast, max_errors)
+        if errors or result.errors:
+            # Rendered messages are compact and always picklable, unlike values and annotations of errors.
+            errors.extend(error.message for error in result.errors)
+            failures.append((row_index, errors if max_errors is None else errors[:max_errors]))
+    return failures
@@ -0,0 +1,99 @@
+"""Opt-in profiling of validation: `TypeValidator.enable_profiling`.
+
+Stats are collected per `(<dataclass>, <param>, <validator>)`. Validator is either a type validator
+    resolved for a param (`annotated_validator`, `set_n_list_validator`, custom function, ...), which time includes
+    all nested checks, or a class of a validator from `Annotated` metadata of a param (`ValueRange`, ...).
+Updates aren't locked: concurrent validations could make counters slightly inaccurate.
+"""
+from collections import deque
+
+StatsKey = tuple[str, str, str]
+
+
+class CheckStats:
+    """Stats of a single check. Percentiles are computed over last `max_samples` durations."""
+
+    __slots__ = ('calls', 'failures', 'total_time', 'samples')
+
+    def __init__(self, max_samples: int):
+        self.calls: int = 0
+        self.failures: int = 0
+        self.total_time: float = 0.0
+        self.samples: deque[float] = deque(maxlen=max_samples)
+
+    def add(self, elapsed: float, failed: bool) -> None:
+        self.calls += 1
+        self.failures += failed
+        self.total_time += elapsed
+        self.samples.append(elapsed)
+
+    def percentile(self, percent: float) -> float:
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+
+class Profiler:
+    """Stats of checks: `{(<dataclass>, <param>, <validator>): CheckStats}`."""
+
+    PERCENTILES = (50, 90, 99)
+
+    def __init__(self, max_samples: int = 1024):
+        self.max_samples = max_samples
+        self.stats: dict[StatsKey, CheckStats] = {}
+
+    def stats_for(self, dataclass_name: str, param_name: str, validator_name: str) -> CheckStats:
+        key = (dataclass_name, param_name, validator_name)
+        stats = self.stats.get(key)
+        if stats is None:
+            stats = self.stats[key] = CheckStats(self.max_samples)
+        return stats
+
+    def reset(self) -> None:
+        self.stats.clear()
+
+    def as_dict(self) -> dict[str, dict[str, dict[str, dict]]]:
+        """Stats as plain dicts: `{<dataclass>: {<param>: {<validator>: {'calls': ..., ...}}}}`.
+
+        Checks are ordered by total time: the hottest ones go first.
+        """
+        result = {}
+        for (dataclass_name, param_name, validator_name), stats in self._ordered():
+            result.setdefault(dataclass_name, {}).setdefault(param_name, {})[validator_name] = {
+                'calls': stats.calls,
+                'failures': stats.failures,
+                'total_time': stats.total_time,
+                **{f'p{percent}': stats.percentile(percent) for percent in self.PERCENTILES},
+            }
+        return result
+
+    def to_prometheus(self, prefix: str = 'type_validator') -> str:
+        """Stats in Prometheus text exposition format. Durations are a summary, in seconds."""
+        ordered = [(_labels(key), stats) for key, stats in self._ordered()]
+        lines = [f'# HELP {prefix}_calls_total Number of checks.', f'# TYPE {prefix}_calls_total counter']
+        lines += [f'{prefix}_calls_total{{{labels}}} {stats.calls}' for labels, stats in ordered]
+        lines += [f'# HELP {prefix}_failures_total Number of failed checks.', f'# TYPE {prefix}_failures_total counter']
+        lines += [f'{prefix}_failures_total{{{labels}}} {stats.failures}' for labels, stats in ordered]
+        lines += [f'# HELP {prefix}_duration_seconds Duration of checks.', f'# TYPE {prefix}_duration_seconds summary']
+        for labels, stats in ordered:
+            lines += [
+                f'{prefix}_duration_seconds{{{labels},quantile="{percent / 100}"}} {stats.percentile(percent):.9f}'
+                for percent in self.PERCENTILES
+            ]
+            lines += [
+                f'{prefix}_duration_seconds_sum{{{labels}}} {stats.total_time:.9f}',
+                f'{prefix}_duration_seconds_count{{{labels}}} {stats.calls}',
+            ]
+        return '\n'.join(lines) + '\n'
+
+    def _ordered(self) -> list[tuple[StatsKey, CheckStats]]:
+        return sorted(self.stats.items(), key=lambda item: item[1].total_time, reverse=True)
+
+
+def _labels(key: StatsKey) -> str:
+    return ','.join(f'{label}="{_escape(value)}"' for label, value in zip(('dataclass', 'param', 'validator'), key))
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
@@ -0,0 +1,120 @@
+"""Streaming validation of line-delimited JSON records: `iter_validated`.
+
+Records are decoded line by line, and raw values are validated with a compiled plan before an instance is built.
+    So invalid records never become instances, and valid ones aren't validated twice.
+Only a single line is held in memory at a time, so files of any size could be read.
+"""
+import json
+import mmap
+import os
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from typing import Any, BinaryIO, TextIO
+
+from .base_dataclass import _prevalidated
+from .base_validator import TypeValidator
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+Source = BinaryIO | TextIO | bytes | bytearray | mmap.mmap | str | os.PathLike
+Decoder = Callable[[bytes | str], Any]
+
+_default_type_validator = TypeValidator()
+
+
+class RecordError:
+    """Invalid record of a stream. `errors` are either validation errors, or a reason why record wasn't decoded/built."""
+
+    __slots__ = ('line_number', 'errors')
+
+    def __init__(self, line_number: int, errors: list):
+        self.line_number: int = line_number
+        self.errors: list = errors
+
+    def __repr__(self) -> str:
+        return f'RecordError(line_number={self.line_number}, errors={self.errors!r})'
+
+
+def iter_validated(
+        cls: type, source: Source, decoder: Decoder | None = None, build: bool = True,
+        type_validator: TypeValidator | None = None, fail_fast: bool | None = None, max_errors: int | None = None,
+) -> Iterator[Any | RecordError]:
+    """Decode records from line-delimited JSON, validate, and yield instances of `cls`, or `RecordError`.
+
+    `source` is a file object (binary or text), bytes, `mmap`, or a path of a file. Blank lines are skipped.
+        `mmap` is read from its current position.
+    `decoder` decodes a single line. Defaults to `orjson.loads`, when it's installed, or `json.loads`.
+    `build=False` only validates records: instances aren't built, and only `RecordError` are yielded.
+    `type_validator`, `fail_fast` and `max_errors` default to settings of `cls`. See `BaseDataclass`.
+    """
+    if decoder is None:
+        decoder = json.loads if orjson is None else orjson.loads
+    if type_validator is None:
+        type_validator = getattr(cls, 'TYPE_VALIDATOR', _default_type_validator)
+    fail_fast = getattr(cls, 'FAIL_FAST', False) if fail_fast is None else fail_fast
+    max_errors = getattr(cls, 'MAX_ERRORS', None) if max_errors is None else max_errors
+
+    for line_number, line in _iter_lines(source):
+        if not line.strip():
+            continue
+        try:
+            data = decoder(line)
+        except ValueError as error:  # JSONDecodeError and errors of other decoders.
+            yield RecordError(line_number, [f'Record could not be decoded: {error}'])
+            continue
+        if not isinstance(data, Mapping):
+            yield RecordError(line_number, [f'Record should be a mapping. Decoded value of type "{type(data)}".'])
+            continue
+
+        # Unknown and missing params are reported in both modes: a record is valid only if it could be built.
+        errors = type_validator.check_params(cls, data)
+        if errors and fail_fast:
+            yield RecordError(line_number, errors[:1])
+            continue
+        result = type_validator.validate_mapping(cls, data, fail_fast, max_errors)
+        if errors or result.valid is False:
+            errors.extend(result.errors)
+            yield RecordError(line_number, errors if max_errors is None else errors[:max_errors])
+            continue
+        if not build:
+            continue
+
+        # Context isn't left changed, while a consumer handles a yielded instance.
+        token = _prevalidated.set((cls, data))
+        try:
+            instance = cls(**data)
+        except (TypeError, ValueError) as error:  # Custom validators, or `__post_init__`.
+            instance = RecordError(line_number, [f'Record could not be built: {error}'])
+        finally:
+            _prevalidated.reset(token)
+        yield instance
+
+
+def _iter_lines(source: Source) -> Iterable[tuple[int, bytes | str]]:
+    """Numbered lines of a source, starting from 1. Lines are read lazily."""
+    if isinstance(source, str | os.PathLike):
+        with open(source, 'rb') as file:
+            yield from enumerate(file, 1)
+    elif isinstance(source, mmap.mmap):
+        yield from enumerate(iter(source.readline, b''), 1)
+    elif isinstance(source, bytes | bytearray):
+        yield from enumerate(_split_lines(source), 1)
+    elif isinstance(source, Iterable) and not isinstance(source, memoryview):
+        yield from enumerate(source, 1)
+    else:
+        # Iteration of a memoryview yields ints, not lines.
+        raise TypeError(
+            f'Source of type "{type(source)}" is not supported. Pass a file object, bytes, bytearray, mmap or a path.'
+        )
+
+
+def _split_lines(data: bytes | bytearray) -> Iterator[bytes]:
+    """Lines of in-memory data. Unlike `splitlines`, only a current line is copied."""
+    start, size = 0, len(data)
+    while start < size:
+        end = data.find(b'\n', start)
+        end = size if end == -1 else end + 1
+        yield bytes(data[start:end])
+        start = end
@@ -1,8 +1,16 @@
+import random
 from abc import ABC, abstractmethod
-from collections.abc import Collection, Sized
+from collections.abc import Collection, Iterable, Sequence, Sized
 from dataclasses import dataclass
 from typing import Any
 
+from .errors import format_value
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
 
 @dataclass
 class ValidatorBase(ABC):
@@ -10,6 +18,35 @@ class ValidatorBase(ABC):
     def validate(self, value: Any) -> tuple[bool, str]:
         pass
 
+    def is_valid(self, value: Any) -> bool:
+        """Check a value without building an error message."""
+        return self.validate(value)[0]
+
+    def describe(self, value: Any) -> str:
+        """Error message for an invalid value. Rendered only when error is read."""
+        return self.validate(value)[1]
+
+    def validate_many(self, values: Sequence) -> tuple[Sequence[bool], list[int]]:
+        """Check values at once, without building error messages: `(<mask of valid values>, <invalid indexes>)`.
+
+        NumPy arrays are checked with vectorized operations, when validator supports it. Mask is an array then.
+        """
+        if np is not None and isinstance(values, np.ndarray) and values.dtype.kind != 'O':
+            mask = self._array_mask(values)
+            if mask is not None:
+                return mask, np.flatnonzero(~mask).tolist()
+
+        mask = self._values_mask(values)
+        return mask, [i for i, res in enumerate(mask) if not res]
+
+    def _array_mask(self, values) -> Any:
+        """Mask of valid array entries. None, when validator can't be applied to an array at once."""
+        return None
+
+    def _values_mask(self, values: Iterable) -> list[bool]:
+        is_valid = self.is_valid
+        return [is_valid(value) is not False for value in values]
+
 
 @dataclass
 class ValueRange(ValidatorBase):
@@ -17,26 +54,101 @@ class ValueRange(ValidatorBase):
     hi: int | float
 
     def validate(self, value: int | float) -> tuple[bool, str]:
-        res = self.lo <= value <= self.hi
-        return res, '' if res is True else (
-            f'Value "{value}" should met this condition: ' f'{self.lo} <= <value> <= {self.hi}.'
-        )
+        res = self.is_valid(value)
+        return res, '' if res is True else self.describe(value)
+
+    def is_valid(self, value: int | float) -> bool:
+        return self.lo <= value <= self.hi
+
+    def describe(self, value: int | float) -> str:
+        return f'Value "{format_value(value)}" should met this condition: ' f'{self.lo} <= <value> <= {self.hi}.'
+
+    def _array_mask(self, values) -> Any:
+        if values.dtype.kind in 'biuf':
+            return (self.lo <= values) & (values <= self.hi)
+        return None
+
+    def _values_mask(self, values: Iterable[int | float]) -> list[bool]:
+        lo, hi = self.lo, self.hi
+        return [lo <= value <= hi for value in values]
 
 
 @dataclass
 class NotEmpty(ValidatorBase):
     def validate(self, value: Sized) -> tuple[bool, str]:
-        res = len(value) > 0
-        return res, '' if res is True else f'Value "{value}" should be not empty.'
+        res = self.is_valid(value)
+        return res, '' if res is True else self.describe(value)
+
+    def is_valid(self, value: Sized) -> bool:
+        return len(value) > 0
+
+    def describe(self, value: Sized) -> str:
+        return f'Value "{format_value(value)}" should be not empty.'
+
+    def _array_mask(self, values) -> Any:
+        if values.dtype.kind in 'US':
+            return np.char.str_len(values) > 0
+        return None
+
+    def _values_mask(self, values: Iterable[Sized]) -> list[bool]:
+        return [len(value) > 0 for value in values]
 
 
 @dataclass
 class Options(ValidatorBase):
+    """Value should be one of `opts`.
+
+    Options are indexed on a first check: hashable ones into a frozenset, unhashable ones are scanned.
+        So `opts` shouldn't be changed after a first check.
+    """
+
     opts: Collection[str | int]
 
     def validate(self, value: str | int) -> tuple[bool, str]:
-        res = value in self.opts
-        return res, '' if res is True else f'Value "{value}" should be chosen from this options: {self.opts}'
+        res = self.is_valid(value)
+        return res, '' if res is True else self.describe(value)
+
+    def is_valid(self, value: str | int) -> bool:
+        hashable, unhashable = self._index()
+        try:
+            if value in hashable:
+                return True
+        except TypeError:  # Unhashable value.
+            pass
+        return value in unhashable if unhashable else False
+
+    def _index(self) -> tuple[frozenset, tuple]:
+        index = self.__dict__.get('_opts_index')
+        if index is None:
+            hashable, unhashable = [], []
+            for option in self.opts:
+                try:
+                    hash(option)
+                except TypeError:
+                    unhashable.append(option)
+                else:
+                    hashable.append(option)
+            index = self.__dict__['_opts_index'] = (frozenset(hashable), tuple(unhashable))
+        return index
+
+    def describe(self, value: str | int) -> str:
+        return f'Value "{format_value(value)}" should be chosen from this options: {self.opts}'
+
+    def _array_mask(self, values) -> Any:
+        hashable, unhashable = self._index()
+        if unhashable:
+            return None
+        return np.isin(values, list(hashable))
+
+    def _values_mask(self, values: Iterable[str | int]) -> list[bool]:
+        hashable, unhashable = self._index()
+        if not unhashable:
+            try:
+                return [value in hashable for value in values]
+            except TypeError:  # Unhashable value.
+                pass
+        is_valid = self.is_valid
+        return [is_valid(value) for value in values]
 
 
 @dataclass
@@ -48,5 +160,48 @@ class LimitedLength(ValidatorBase):
             raise ValueError('length should bigger than 0.')
 
     def validate(self, value: Sized) -> tuple[bool, str]:
-        res = len(value) <= self.length
-        return res, '' if res is True else f'Value "{value}" length should be <= {self.length}. Actual is {len(value)}'
+        res = self.is_valid(value)
+        return res, '' if res is True else self.describe(value)
+
+    def is_valid(self, value: Sized) -> bool:
+        return len(value) <= self.length
+
+    def describe(self, value: Sized) -> str:
+        return f'Value "{format_value(value)}" length should be <= {self.length}. Actual is {len(value)}'
+
+    def _array_mask(self, values) -> Any:
+        if values.dtype.kind in 'US':
+            return np.char.str_len(values) <= self.length
+        return None
+
+    def _values_mask(self, values: Iterable[Sized]) -> list[bool]:
+        length = self.length
+        return [len(value) <= length for value in values]
+
+
+@dataclass(frozen=True)
+class Sampling:
+    """Policy of a partial validation for big collections. Not a validator: it limits entries checked by others.
+
+    Only first `head`, last `tail` and `random` entries from the middle are checked.
+        Unordered collections (set, dict) get first `head + tail + random` entries.
+    `skip_unchanged=True` skips validation of a collection, which was already successfully checked,
+        if it's the same object, with the same length. Up to `unchanged_size` last checked collections are
+        remembered per param annotation, and referenced until evicted: they aren't freed before that.
+    Per param: `Annotated[list[float], Sampling(head=10)]`. Per class: `SAMPLING = Sampling()` class attribute.
+    Results of partial validation are marked: see `ValidationResult.sampled`.
+    """
+
+    head: int = 100
+    tail: int = 100
+    random: int = 100
+    skip_unchanged: bool = False
+    unchanged_size: int = 8
+
+    def indexes(self, size: int) -> list[int] | None:
+        """Sorted indexes of entries to check. None, when collection is small enough to be checked fully."""
+        if size <= self.head + self.tail + self.random:
+            return None
+
+        picked = random.sample(range(self.head, size - self.tail), self.random)
+        return [*range(self.head), *sorted(picked), *range(size - self.tail, size)]